@@ -0,0 +1,223 @@
+"""
+Generators for Slack Markdown, Rich Text and Block Kit samples.
+
+Samples are drawn with Hypothesis when it is installed and from a seeded
+`random.Random` otherwise, so every run with the same seed is reproducible.
+"""
+import random
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import hypothesis
+    from hypothesis import strategies as st
+except ImportError:  # pragma: no cover - exercised only without hypothesis
+    hypothesis = None
+    st = None
+
+WORDS = [
+    "alpha", "beta", "gamma", "delta", "deploy", "release", "ticket", "review",
+    "build", "green", "red", "queue", "worker", "cache", "index", "shard",
+]
+EMOJI = ["tada", "rocket", "white_check_mark", "eyes", "fire"]
+USERS = ["U012AB3CD", "U045EF6GH", "U078IJ9KL"]
+STYLES = ["bold", "italic", "strike", "code"]
+MD_DELIMITERS = {"bold": "*", "italic": "_", "strike": "~", "code": "`"}
+
+SOURCE_KINDS = ("markdown", "richtext", "blockkit")
+
+
+def hypothesis_available() -> bool:
+    """Return True if Hypothesis can be used to draw samples."""
+    return hypothesis is not None
+
+
+# Seeded fallback generators
+
+def _random_words(rng: random.Random, low: int = 1, high: int = 3) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def _random_md_run(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.5:
+        return _random_words(rng)
+    if kind < 0.85:
+        delimiter = MD_DELIMITERS[rng.choice(STYLES)]
+        return f"{delimiter}{_random_words(rng)}{delimiter}"
+    word = rng.choice(WORDS)
+    return f"<https://example.com/{word}|{word}>"
+
+
+def random_markdown(rng: random.Random) -> str:
+    """Generate a Slack Markdown document of paragraphs and list items."""
+    lines = []
+    for _ in range(rng.randint(1, 4)):
+        line = " ".join(_random_md_run(rng) for _ in range(rng.randint(1, 4)))
+        marker = rng.random()
+        if marker < 0.2:
+            line = f"• {line}"
+        elif marker < 0.3:
+            line = f"1. {line}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _random_rt_element(rng: random.Random) -> Dict[str, Any]:
+    kind = rng.random()
+    if kind < 0.45:
+        return {"type": "text", "text": _random_words(rng)}
+    if kind < 0.75:
+        return {"type": "text", "text": _random_words(rng), "style": {rng.choice(STYLES): True}}
+    if kind < 0.85:
+        word = rng.choice(WORDS)
+        return {"type": "link", "url": f"https://example.com/{word}", "text": word}
+    if kind < 0.93:
+        return {"type": "emoji", "name": rng.choice(EMOJI)}
+    return {"type": "user", "user_id": rng.choice(USERS)}
+
+
+def _random_rt_section(rng: random.Random) -> Dict[str, Any]:
+    elements = []
+    for _ in range(rng.randint(1, 4)):
+        if elements:
+            elements.append({"type": "text", "text": " "})
+        elements.append(_random_rt_element(rng))
+    return {"type": "rich_text_section", "elements": elements}
+
+
+def random_richtext(rng: random.Random) -> Dict[str, Any]:
+    """Generate a Rich Text tree of sections and lists."""
+    blocks = []
+    for _ in range(rng.randint(1, 3)):
+        if rng.random() < 0.25:
+            blocks.append({
+                "type": "rich_text_list",
+                "style": rng.choice(["bullet", "ordered"]),
+                "elements": [_random_rt_section(rng) for _ in range(rng.randint(1, 3))],
+            })
+        else:
+            blocks.append(_random_rt_section(rng))
+    if len(blocks) == 1:
+        return blocks[0]
+    return {"type": "rich_text", "elements": blocks}
+
+
+def random_blockkit(rng: random.Random) -> Dict[str, Any]:
+    """Generate a single Block Kit block."""
+    kind = rng.random()
+    if kind < 0.6:
+        return {"type": "section", "text": {"type": "mrkdwn", "text": random_markdown(rng)}}
+    if kind < 0.75:
+        return {"type": "header", "text": {"type": "plain_text", "text": _random_words(rng)}}
+    if kind < 0.85:
+        return {"type": "context", "elements": [{"type": "mrkdwn", "text": _random_md_run(rng)}]}
+    richtext = random_richtext(rng)
+    elements = richtext["elements"] if richtext["type"] == "rich_text" else [richtext]
+    return {"type": "rich_text", "elements": elements}
+
+
+RANDOM_GENERATORS: Dict[str, Callable[[random.Random], Any]] = {
+    "markdown": random_markdown,
+    "richtext": random_richtext,
+    "blockkit": random_blockkit,
+}
+
+
+# Hypothesis strategies
+
+def _strategies() -> Dict[str, Any]:
+    words = st.lists(st.sampled_from(WORDS), min_size=1, max_size=3).map(" ".join)
+    styled_run = st.tuples(st.sampled_from(STYLES), words).map(
+        lambda pair: f"{MD_DELIMITERS[pair[0]]}{pair[1]}{MD_DELIMITERS[pair[0]]}"
+    )
+    link_run = st.sampled_from(WORDS).map(lambda word: f"<https://example.com/{word}|{word}>")
+    md_line = st.lists(st.one_of(words, styled_run, link_run), min_size=1, max_size=4).map(" ".join)
+    md_line = st.tuples(st.sampled_from(["", "", "", "• ", "1. "]), md_line).map("".join)
+    markdown = st.lists(md_line, min_size=1, max_size=4).map("\n".join)
+
+    rt_element = st.one_of(
+        words.map(lambda text: {"type": "text", "text": text}),
+        st.tuples(st.sampled_from(STYLES), words).map(
+            lambda pair: {"type": "text", "text": pair[1], "style": {pair[0]: True}}
+        ),
+        st.sampled_from(WORDS).map(
+            lambda word: {"type": "link", "url": f"https://example.com/{word}", "text": word}
+        ),
+        st.sampled_from(EMOJI).map(lambda name: {"type": "emoji", "name": name}),
+        st.sampled_from(USERS).map(lambda user_id: {"type": "user", "user_id": user_id}),
+    )
+
+    def _spaced(elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+        spaced = []
+        for element in elements:
+            if spaced:
+                spaced.append({"type": "text", "text": " "})
+            spaced.append(element)
+        return {"type": "rich_text_section", "elements": spaced}
+
+    rt_section = st.lists(rt_element, min_size=1, max_size=4).map(_spaced)
+    rt_list = st.tuples(st.sampled_from(["bullet", "ordered"]), st.lists(rt_section, min_size=1, max_size=3)).map(
+        lambda pair: {"type": "rich_text_list", "style": pair[0], "elements": pair[1]}
+    )
+    richtext = st.lists(st.one_of(rt_section, rt_section, rt_list), min_size=1, max_size=3).map(
+        lambda blocks: blocks[0] if len(blocks) == 1 else {"type": "rich_text", "elements": blocks}
+    )
+
+    blockkit = st.one_of(
+        markdown.map(lambda text: {"type": "section", "text": {"type": "mrkdwn", "text": text}}),
+        words.map(lambda text: {"type": "header", "text": {"type": "plain_text", "text": text}}),
+        st.one_of(words, styled_run).map(
+            lambda text: {"type": "context", "elements": [{"type": "mrkdwn", "text": text}]}
+        ),
+        st.lists(st.one_of(rt_section, rt_list), min_size=1, max_size=3).map(
+            lambda blocks: {"type": "rich_text", "elements": blocks}
+        ),
+    )
+    return {"markdown": markdown, "richtext": richtext, "blockkit": blockkit}
+
+
+def _draw_with_hypothesis(strategy: Any, count: int, seed: int) -> List[Any]:
+    samples: List[Any] = []
+
+    @hypothesis.seed(seed)
+    @hypothesis.settings(
+        max_examples=count,
+        database=None,
+        deadline=None,
+        phases=[hypothesis.Phase.generate],
+        suppress_health_check=list(hypothesis.HealthCheck),
+    )
+    @hypothesis.given(strategy)
+    def collect(value: Any) -> None:
+        samples.append(value)
+
+    collect()
+    return samples[:count]
+
+
+def generate_samples(kind: str, count: int, seed: int = 0, use_hypothesis: Optional[bool] = None) -> List[Any]:
+    """
+    Generate `count` samples of the given source kind.
+
+    Args:
+        kind: One of "markdown", "richtext" or "blockkit".
+        count: Number of samples to generate.
+        seed: Seed for reproducible generation.
+        use_hypothesis: Force (True) or disable (False) Hypothesis; by default it
+            is used whenever it is installed.
+
+    Returns:
+        A list of generated samples.
+    """
+    if kind not in SOURCE_KINDS:
+        raise ValueError(f"Unknown sample kind: {kind!r}")
+    if use_hypothesis is None:
+        use_hypothesis = hypothesis_available()
+    if use_hypothesis:
+        if not hypothesis_available():
+            raise ImportError("hypothesis is not installed")
+        return _draw_with_hypothesis(_strategies()[kind], count, seed)
+
+    rng = random.Random(f"{kind}:{seed}")
+    generator = RANDOM_GENERATORS[kind]
+    return [generator(rng) for _ in range(count)]
@@ -0,0 +1,89 @@
+"""
+Escaping throughput on escape-heavy text: per-call regex substitution (as
+escape_markdown_chars used to do) versus slackformat.utils.escape_utils.
+
+Usage:
+    python -m benchmarks.escaping [--strings N] [--length L] [--repeat R]
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from slackformat.utils.escape_utils import (
+    MARKDOWN_SPECIAL_CHARS, SLACK_ENTITIES, escape_markdown, escape_mrkdwn, unescape_entities,
+)
+
+_ALPHABET = "abcdefghij    " + MARKDOWN_SPECIAL_CHARS + "&<>"
+_MRKDWN_CHARS = {char: entity for entity, char in SLACK_ENTITIES.items()}
+
+
+def regex_escape_markdown(text: str) -> str:
+    """The original escape_markdown_chars: the pattern is rebuilt on every call."""
+    if not text:
+        return ""
+    return re.sub(f'([{re.escape(MARKDOWN_SPECIAL_CHARS)}])', r'\\\1', text)
+
+
+def regex_escape_mrkdwn(text: str) -> str:
+    return re.sub('[&<>]', lambda match: _MRKDWN_CHARS[match.group()], text)
+
+
+def regex_unescape_entities(text: str) -> str:
+    return re.sub('&(amp|lt|gt);', lambda match: SLACK_ENTITIES[match.group()], text)
+
+
+def build_strings(count: int, length: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choice(_ALPHABET) for _ in range(length)) for _ in range(count)]
+
+
+def _time(function: Callable[[str], str], strings: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in strings:
+            function(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(strings: int = 20000, length: int = 80, repeat: int = 5) -> List[Dict[str, object]]:
+    """Time each (operation, implementation) pair, checking both produce the same output."""
+    inputs = build_strings(strings, length)
+    encoded = [escape_mrkdwn(text) for text in inputs]
+    cases = [
+        ("markdown escape", inputs, regex_escape_markdown, escape_markdown),
+        ("mrkdwn escape", inputs, regex_escape_mrkdwn, escape_mrkdwn),
+        ("entity decode", encoded, regex_unescape_entities, unescape_entities),
+    ]
+    results = []
+    for operation, data, baseline, table in cases:
+        if [baseline(text) for text in data] != [table(text) for text in data]:
+            raise AssertionError(f"{operation}: implementations disagree")
+        for name, function in (("regex", baseline), ("escape_utils", table)):
+            seconds = _time(function, data, repeat)
+            results.append({"operation": operation, "implementation": name,
+                            "seconds": seconds, "mb_per_sec": len(data) * length / seconds / 1_000_000})
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strings", type=int, default=20000)
+    parser.add_argument("--length", type=int, default=80)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"# {args.strings} strings of {args.length} chars, best of {args.repeat}")
+    print(f"{'operation':<18} {'impl':<13} {'seconds':>9} {'MB/s':>8}")
+    for result in run(args.strings, args.length, args.repeat):
+        print(f"{result['operation']:<18} {result['implementation']:<13} "
+              f"{result['seconds']:>9.4f} {result['mb_per_sec']:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+A small HDR-style latency histogram.
+
+Values are bucketed log-linearly: every power-of-two range is split into
+2**precision linear sub-buckets, so any recorded value is reported within a
+relative error of 2**-precision while the bucket count grows only with the
+logarithm of the range. Counts are held sparsely in a dict, so histograms
+are cheap to pickle and merge across threads and processes.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """Records non-negative integer values (e.g. microseconds) and reports percentiles."""
+
+    def __init__(self, precision: int = 7):
+        if not 1 <= precision <= 16:
+            raise ValueError("precision must be between 1 and 16")
+        self.precision = precision
+        self._sub_buckets = 1 << precision
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def record(self, value: int, count: int = 1) -> None:
+        """Record `value` `count` times. Negative values are clamped to zero."""
+        value = max(int(value), 0)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add another histogram's counts into this one and return self."""
+        if other.precision != self.precision:
+            raise ValueError("cannot merge histograms of different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """
+        Return the highest value equivalent to the bucket holding the given
+        percentile, so reported percentiles never understate a latency.
+        """
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percentile // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def percentiles(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[float, int]:
+        return {percentile: self.value_at_percentile(percentile) for percentile in percentiles}
+
+    def buckets(self) -> List[Tuple[int, int, int]]:
+        """Return the non-empty buckets as (lower bound, upper bound, count)."""
+        return [(self._lower_bound(index), self._upper_bound(index), self.counts[index])
+                for index in sorted(self.counts)]
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_buckets:
+            return value
+        shift = value.bit_length() - 1 - self.precision
+        return (shift + 1) * self._sub_buckets + (value >> shift) - self._sub_buckets
+
+    def _lower_bound(self, index: int) -> int:
+        if index < self._sub_buckets:
+            return index
+        shift = index // self._sub_buckets - 1
+        return (self._sub_buckets + index % self._sub_buckets) << shift
+
+    def _upper_bound(self, index: int) -> int:
+        return self._lower_bound(index + 1) - 1
\ No newline at end of file
@@ -0,0 +1,374 @@
+"""
+Soak/load test for the converters exported by slackformat.
+
+Every converter function in `slackformat.__init_.__all__` is driven from a
+weighted, mixed corpus at a target rate across N threads or processes for a
+fixed duration. Latencies go into per-converter HDR-style histograms and are
+measured from each operation's scheduled start, so a stalled worker shows up
+as latency instead of silently lowering the request rate. RSS (and, with
+--tracemalloc, traced Python memory) is sampled over time in every worker
+process, and sustained monotonic growth is flagged. The exit status is 1 if
+growth was flagged or any conversion raised.
+
+Exported classes are exercised through the functions, which wrap their
+default instances.
+
+Usage:
+    python -m benchmarks.loadtest [--duration S] [--rate OPS] [--workers N] [--processes]
+                                  [--weight NAME=W ...] [--tracemalloc] [--json]
+"""
+import argparse
+import collections
+import importlib
+import inspect
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from benchmarks.corpus import SOURCE_KINDS, generate_samples
+from benchmarks.histogram import DEFAULT_PERCENTILES, LatencyHistogram
+from benchmarks.memory import GrowthReport, current_rss, detect_growth, format_bytes
+
+# Input kind for each exported converter function
+EXPORT_INPUTS: Dict[str, str] = {
+    "md_to_richtext": "markdown",
+    "richtext_to_blockkit": "richtext",
+    "blockkit_to_richtext": "blockkit",
+    "blockkit_to_markdown": "blockkit",
+    "richtext_to_markdown": "richtext",
+    "md_to_blockkit": "markdown",
+    "convert_message": "message",
+    "blockkit_to_plain": "blocks",
+    "extract_search_document": "blocks",
+    "iter_search_documents": "messages",
+}
+
+# Rough production mix: whole messages dominate, single-format hops follow
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "convert_message": 4,
+    "md_to_richtext": 3,
+    "blockkit_to_markdown": 3,
+    "extract_search_document": 2,
+}
+
+
+class MemorySample(NamedTuple):
+    elapsed: float
+    rss: int
+    traced: int
+
+
+class LoadConfig(NamedTuple):
+    duration: float
+    rate: float
+    weights: Dict[str, float]
+    seed: int
+    corpus_size: int
+    sample_interval: float
+    tracemalloc: bool
+    warmup: float
+
+
+class WorkerResult(NamedTuple):
+    pid: int
+    operations: int
+    seconds: float
+    histograms: Dict[str, LatencyHistogram]
+    errors: Dict[str, int]
+    samples: List[MemorySample]
+    top_growth: List[str]
+
+
+class LoadTestResult(NamedTuple):
+    workers: int
+    processes: bool
+    rate: float
+    operations: int
+    seconds: float
+    histograms: Dict[str, LatencyHistogram]
+    errors: Dict[str, int]
+    memory: List[Dict[str, Any]]
+
+    @property
+    def achieved_rate(self) -> float:
+        return self.operations / self.seconds if self.seconds else 0.0
+
+    @property
+    def growing(self) -> bool:
+        return any(report["rss_growth"].growing or report["traced_growth"].growing for report in self.memory)
+
+
+def discover_converters(module: Any = None) -> Dict[str, Callable[[Any], Any]]:
+    """Return the converter functions exported by slackformat, keyed by name."""
+    module = module or importlib.import_module("slackformat.__init_")
+    converters = {}
+    for name in module.__all__:
+        obj = getattr(module, name)
+        if not inspect.isfunction(obj):
+            continue
+        if name not in EXPORT_INPUTS:
+            raise KeyError(f"{name} is exported but has no input kind in EXPORT_INPUTS")
+        converters[name] = obj
+    return converters
+
+
+def build_corpus(size: int, seed: int = 0) -> Dict[str, List[Any]]:
+    """Generate `size` inputs of every kind listed in EXPORT_INPUTS."""
+    rng = random.Random(seed)
+    corpus = {kind: generate_samples(kind, size, seed, use_hypothesis=False) for kind in SOURCE_KINDS}
+    markdown, blockkit = corpus["markdown"], corpus["blockkit"]
+
+    def blocks() -> List[Dict[str, Any]]:
+        return rng.sample(blockkit, min(len(blockkit), rng.randint(1, 4)))
+
+    def message() -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"text": rng.choice(markdown)}
+        if rng.random() < 0.6:
+            payload["blocks"] = blocks()
+        if rng.random() < 0.3:
+            payload["attachments"] = [{"pretext": rng.choice(markdown), "title": "build",
+                                       "title_link": "https://example.com/build", "blocks": blocks()}]
+        return payload
+
+    corpus["blocks"] = [blocks() for _ in range(size)]
+    corpus["message"] = [message() for _ in range(size)]
+    corpus["messages"] = [[blocks() for _ in range(rng.randint(1, 5))] for _ in range(size)]
+    return corpus
+
+
+def _traced() -> int:
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+
+def _top_growth(first: Optional[tracemalloc.Snapshot], last: Optional[tracemalloc.Snapshot], limit: int = 5) -> List[str]:
+    if first is None or last is None:
+        return []
+    # Leave out the harness's own allocations, such as histogram buckets
+    harness = [tracemalloc.Filter(False, os.path.join(os.path.dirname(os.path.abspath(__file__)), "*"))]
+    stats = last.filter_traces(harness).compare_to(first.filter_traces(harness), "lineno")
+    stats = [stat for stat in stats if stat.size_diff > 0]
+    return [str(stat) for stat in stats[:limit]]
+
+
+def _worker(index: int, config: LoadConfig, sample_memory: bool) -> WorkerResult:
+    """Run one worker's share of the load; optionally sample this process's memory."""
+    converters = discover_converters()
+    names = [name for name in converters if config.weights.get(name, 1) > 0]
+    weights = [config.weights.get(name, 1) for name in names]
+    corpus = build_corpus(config.corpus_size, config.seed + index)
+    rng = random.Random(config.seed * 7919 + index)
+
+    trace = sample_memory and config.tracemalloc
+    if trace and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    first_snapshot = None
+
+    histograms = {name: LatencyHistogram() for name in names}
+    errors = {name: 0 for name in names}
+    samples: List[MemorySample] = []
+    interval = 1.0 / config.rate if config.rate > 0 else 0.0
+    operations = 0
+
+    start = time.perf_counter()
+    deadline = start + config.duration
+    warmed_up = start + config.duration * config.warmup
+    next_at = next_sample = start
+    while True:
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        if sample_memory and now >= next_sample:
+            samples.append(MemorySample(now - start, current_rss(), _traced()))
+            next_sample += config.sample_interval
+            if trace and first_snapshot is None and now >= warmed_up:
+                first_snapshot = tracemalloc.take_snapshot()
+        if interval:
+            if next_at >= deadline:
+                break
+            if next_at > now:
+                time.sleep(next_at - now)
+            scheduled, next_at = next_at, next_at + interval
+        else:
+            scheduled = now
+
+        name = rng.choices(names, weights)[0]
+        payload = rng.choice(corpus[EXPORT_INPUTS[name]])
+        try:
+            result = converters[name](payload)
+            if isinstance(result, Iterator):
+                collections.deque(result, maxlen=0)
+        except Exception:
+            errors[name] += 1
+        histograms[name].record((time.perf_counter() - scheduled) * 1_000_000)
+        operations += 1
+
+    seconds = time.perf_counter() - start
+    top_growth: List[str] = []
+    if sample_memory:
+        samples.append(MemorySample(seconds, current_rss(), _traced()))
+        if trace:
+            top_growth = _top_growth(first_snapshot, tracemalloc.take_snapshot())
+            tracemalloc.stop()
+    return WorkerResult(os.getpid(), operations, seconds, histograms, errors, samples, top_growth)
+
+
+def run(
+    duration: float = 60.0,
+    rate: float = 0.0,
+    workers: int = 1,
+    processes: bool = False,
+    weights: Optional[Dict[str, float]] = None,
+    seed: int = 0,
+    corpus_size: int = 500,
+    sample_interval: float = 1.0,
+    trace: bool = False,
+    warmup: float = 0.2,
+    min_growth: int = 1024 * 1024,
+) -> LoadTestResult:
+    """
+    Run the load test. `rate` is the total target in operations per second
+    across all workers (0 runs unthrottled). With `processes`, each worker is
+    its own process and samples its own memory; with threads, the first
+    worker samples the shared process.
+    """
+    merged_weights = dict(DEFAULT_WEIGHTS)
+    merged_weights.update(weights or {})
+    unknown = set(merged_weights) - set(discover_converters())
+    if unknown:
+        raise ValueError(f"Unknown converters in weights: {sorted(unknown)}")
+    config = LoadConfig(duration, rate / workers if rate else 0.0, merged_weights, seed,
+                        corpus_size, sample_interval, trace, warmup)
+
+    pool_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        futures = [pool.submit(_worker, index, config, processes or index == 0) for index in range(workers)]
+        results = [future.result() for future in futures]
+
+    histograms: Dict[str, LatencyHistogram] = {}
+    errors: Dict[str, int] = collections.Counter()
+    memory = []
+    for result in results:
+        for name, histogram in result.histograms.items():
+            histograms.setdefault(name, LatencyHistogram()).merge(histogram)
+        errors.update(result.errors)
+        if result.samples:
+            times = [sample.elapsed for sample in result.samples]
+            memory.append({
+                "pid": result.pid,
+                "samples": result.samples,
+                "rss_growth": detect_growth(times, [sample.rss for sample in result.samples], warmup, min_growth=min_growth),
+                "traced_growth": detect_growth(times, [sample.traced for sample in result.samples], warmup, min_growth=min_growth),
+                "top_growth": result.top_growth,
+            })
+    return LoadTestResult(
+        workers, processes, rate, sum(result.operations for result in results),
+        max(result.seconds for result in results), histograms, dict(errors), memory,
+    )
+
+
+def _growth_line(label: str, report: GrowthReport) -> str:
+    verdict = "GROWING" if report.growing else "ok"
+    return (f"  {label:<7} {format_bytes(report.start):>12} -> {format_bytes(report.end):>12}  "
+            f"{format_bytes(report.bytes_per_sec):>12}/s  {verdict}")
+
+
+def format_report(result: LoadTestResult) -> str:
+    """Render a load test result as text."""
+    kind = "processes" if result.processes else "threads"
+    target = f"{result.rate:,.0f} ops/s" if result.rate else "unthrottled"
+    lines = [
+        f"# {result.seconds:.1f} s, {result.workers} {kind}, target {target}, "
+        f"achieved {result.achieved_rate:,.0f} ops/s, {result.operations:,} ops, "
+        f"{sum(result.errors.values())} errors",
+        f"{'converter':<24} {'count':>8} {'errors':>6} {'mean':>8} "
+        + " ".join(f"{'p' + format(p, 'g'):>8}" for p in DEFAULT_PERCENTILES) + f" {'max':>8}   (ms)",
+    ]
+    for name, histogram in sorted(result.histograms.items()):
+        percentiles = histogram.percentiles()
+        lines.append(
+            f"{name:<24} {histogram.count:>8,} {result.errors.get(name, 0):>6} {histogram.mean / 1000:>8.3f} "
+            + " ".join(f"{percentiles[p] / 1000:>8.3f}" for p in DEFAULT_PERCENTILES)
+            + f" {(histogram.max or 0) / 1000:>8.3f}"
+        )
+    for report in result.memory:
+        lines.append(f"memory (pid {report['pid']}, {len(report['samples'])} samples):")
+        lines.append(_growth_line("rss", report["rss_growth"]))
+        if any(sample.traced for sample in report["samples"]):
+            lines.append(_growth_line("traced", report["traced_growth"]))
+        for stat in report["top_growth"]:
+            lines.append(f"    {stat}")
+    return "\n".join(lines)
+
+
+def to_json(result: LoadTestResult) -> Dict[str, Any]:
+    """Return a JSON-serializable summary of a load test result."""
+    return {
+        "workers": result.workers,
+        "processes": result.processes,
+        "target_rate": result.rate,
+        "achieved_rate": result.achieved_rate,
+        "operations": result.operations,
+        "seconds": result.seconds,
+        "converters": {
+            name: {
+                "count": histogram.count,
+                "errors": result.errors.get(name, 0),
+                "mean_us": histogram.mean,
+                "max_us": histogram.max,
+                "percentiles_us": {format(p, "g"): value for p, value in histogram.percentiles().items()},
+                "buckets_us": histogram.buckets(),
+            }
+            for name, histogram in sorted(result.histograms.items())
+        },
+        "memory": [
+            {
+                "pid": report["pid"],
+                "samples": [sample._asdict() for sample in report["samples"]],
+                "rss_growth": report["rss_growth"]._asdict(),
+                "traced_growth": report["traced_growth"]._asdict(),
+                "top_growth": report["top_growth"],
+            }
+            for report in result.memory
+        ],
+        "growing": result.growing,
+    }
+
+
+def _parse_weight(value: str) -> Any:
+    name, _, weight = value.partition("=")
+    try:
+        return name, float(weight)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=WEIGHT, got {value!r}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds to run")
+    parser.add_argument("--rate", type=float, default=0.0, help="total target ops/sec (0 = unthrottled)")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--processes", action="store_true", help="run workers as processes instead of threads")
+    parser.add_argument("--weight", type=_parse_weight, action="append", default=[],
+                        help="converter weight, e.g. md_to_richtext=5 (repeatable; 0 disables)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--corpus-size", type=int, default=500, help="inputs per kind and worker")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="seconds between memory samples")
+    parser.add_argument("--tracemalloc", action="store_true", help="also trace Python allocations (slower)")
+    parser.add_argument("--min-growth-mb", type=float, default=1.0, help="smallest rise flagged as growth")
+    parser.add_argument("--json", action="store_true", help="emit JSON instead of a report")
+    args = parser.parse_args(argv)
+
+    result = run(args.duration, args.rate, args.workers, args.processes, dict(args.weight), args.seed,
+                 args.corpus_size, args.sample_interval, args.tracemalloc,
+                 min_growth=int(args.min_growth_mb * 1024 * 1024))
+    print(json.dumps(to_json(result), indent=2) if args.json else format_report(result))
+    return 1 if result.growing or any(result.errors.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
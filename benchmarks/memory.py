@@ -0,0 +1,67 @@
+"""Process memory helpers shared by the benchmark harnesses."""
+import os
+import resource
+import sys
+from typing import List, NamedTuple, Sequence
+
+
+def current_rss() -> int:
+    """Return the current resident set size in bytes."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Not Linux: fall back to the peak RSS, which is the best portable proxy
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def format_bytes(count: float) -> str:
+    """Format a byte count with a binary unit suffix."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(count) < 1024 or unit == "GiB":
+            return f"{count:,.1f} {unit}"
+        count /= 1024
+    return f"{count:,.1f} GiB"
+
+
+class GrowthReport(NamedTuple):
+    """The outcome of detect_growth over a series of memory samples."""
+    growing: bool
+    bytes_per_sec: float
+    start: float
+    end: float
+    floors: List[float]
+
+
+def detect_growth(
+    times: Sequence[float],
+    values: Sequence[float],
+    warmup: float = 0.2,
+    windows: int = 4,
+    min_growth: float = 1024 * 1024,
+) -> GrowthReport:
+    """
+    Flag sustained, monotonic growth in a memory series.
+
+    The first `warmup` fraction of samples is discarded (caches and pools
+    filling up), the rest is cut into `windows` consecutive windows, and the
+    minimum of each is taken. Garbage collection makes the peaks noisy, but a
+    leak keeps raising the floor: growth is flagged when every window's floor
+    is higher than the last and the total rise is at least `min_growth`.
+    `bytes_per_sec` is the least-squares slope over the retained samples.
+    """
+    skip = int(len(values) * warmup)
+    times, values = list(times[skip:]), list(values[skip:])
+    if len(values) < windows * 2:
+        return GrowthReport(False, 0.0, values[0] if values else 0.0, values[-1] if values else 0.0, [])
+
+    size = len(values) / windows
+    floors = [float(min(values[int(i * size):int((i + 1) * size)])) for i in range(windows)]
+    mean_t = sum(times) / len(times)
+    mean_v = sum(values) / len(values)
+    variance = sum((t - mean_t) ** 2 for t in times)
+    slope = sum((t - mean_t) * (v - mean_v) for t, v in zip(times, values)) / variance if variance else 0.0
+    monotonic = all(later > earlier for earlier, later in zip(floors, floors[1:]))
+    growing = monotonic and floors[-1] - floors[0] >= min_growth
+    return GrowthReport(growing, slope, float(values[0]), float(values[-1]), floors)
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Resident memory of archive-scale in-memory conversions with and without interning.
+
+Each mode runs in a fresh interpreter so the measurements do not share heap
+state. A pool of distinct messages is sampled with repetition, which mimics an
+export full of bot messages, and every converted tree is kept alive.
+
+Usage:
+    python -m benchmarks.memory_interning [--messages N] [--distinct D] [--converter md|blockkit]
+"""
+import argparse
+import gc
+import json
+import random
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.corpus import generate_samples
+from benchmarks.memory import current_rss, format_bytes
+
+MODES = ("plain", "interned")
+
+
+def _build_archive(kind: str, messages: int, distinct: int, seed: int) -> List[Any]:
+    pool = generate_samples(kind, distinct, seed, use_hypothesis=False)
+    rng = random.Random(seed)
+    # Copy the inputs so repeated messages do not share objects, as they would not after JSON decoding
+    return [json.loads(json.dumps(rng.choice(pool))) for _ in range(messages)]
+
+
+def measure(mode: str, converter_name: str, messages: int, distinct: int, seed: int) -> Dict[str, Any]:
+    """Convert an archive in this process and report the RSS held by the results."""
+    from slackformat.converters.md_to_richtext import MdToRichtextConverter
+    from slackformat.converters.blockkit_to_richtext import BlockkitToRichtextConverter
+
+    intern = mode == "interned"
+    if converter_name == "md":
+        converter = MdToRichtextConverter(intern=intern, collect_stats=False)
+        archive = _build_archive("markdown", messages, distinct, seed)
+    else:
+        converter = BlockkitToRichtextConverter(intern=intern, collect_stats=False)
+        archive = _build_archive("blockkit", messages, distinct, seed)
+
+    gc.collect()
+    before = current_rss()
+    start = time.perf_counter()
+    results = converter.convert_many(archive)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    after = current_rss()
+    return {
+        "mode": mode,
+        "converter": converter_name,
+        "messages": len(results),
+        "rss_delta": after - before,
+        "seconds": seconds,
+    }
+
+
+def run(converter_name: str = "md", messages: int = 200_000, distinct: int = 2_000, seed: int = 0) -> List[Dict[str, Any]]:
+    """Measure each mode in its own subprocess."""
+    results = []
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.memory_interning", "--child", mode,
+             "--converter", converter_name, "--messages", str(messages),
+             "--distinct", str(distinct), "--seed", str(seed)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(output))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--distinct", type=int, default=2_000, help="distinct messages in the archive")
+    parser.add_argument("--converter", choices=("md", "blockkit"), default="md")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.converter, args.messages, args.distinct, args.seed)))
+        return 0
+
+    results = run(args.converter, args.messages, args.distinct, args.seed)
+    print(f"# {args.messages:,} messages ({args.distinct:,} distinct), converter={args.converter}")
+    print(f"{'mode':<10} {'RSS held':>14} {'seconds':>9}")
+    for result in results:
+        print(f"{result['mode']:<10} {format_bytes(result['rss_delta']):>14} {result['seconds']:>9.2f}")
+    plain, interned = results
+    if plain["rss_delta"] > 0:
+        print(f"interning saves {100 * (1 - interned['rss_delta'] / plain['rss_delta']):.0f}% of resident memory")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
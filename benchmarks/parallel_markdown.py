@@ -0,0 +1,62 @@
+"""
+Sequential versus parallel md_to_richtext on very large Markdown documents.
+
+Usage:
+    python -m benchmarks.parallel_markdown [--size-mb N] [--workers W] [--threads]
+"""
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from benchmarks.corpus import random_markdown
+from slackformat.converters.md_to_richtext import MdToRichtextConverter
+
+
+def build_document(size: int, seed: int = 0) -> str:
+    """Build a runbook-like Markdown document of at least `size` characters."""
+    rng = random.Random(seed)
+    parts: List[str] = []
+    total = 0
+    while total < size:
+        part = random_markdown(rng)
+        parts.append(part)
+        total += len(part) + 1
+    return "\n".join(parts)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=8.0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--threads", action="store_true", help="use a thread pool instead of processes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    document = build_document(int(args.size_mb * 1_000_000))
+    sequential = MdToRichtextConverter(parallel_threshold=None, collect_stats=False)
+    executor = ThreadPoolExecutor(args.workers) if args.threads else None
+    parallel = MdToRichtextConverter(parallel_threshold=0, max_workers=args.workers,
+                                     executor=executor, collect_stats=False)
+    parallel.convert("warm up the pool")
+
+    print(f"# {len(document) / 1_000_000:.1f} MB document, best of {args.repeat}")
+    results = {}
+    for label, converter in (("sequential", sequential), ("parallel", parallel)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results[label] = converter.convert(document)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<12} {best:>8.2f} s  {len(document) / best / 1_000_000:>8.2f} MB/s")
+    parallel.close()
+    if executor is not None:
+        executor.shutdown()
+    print("identical output:", results["sequential"] == results["parallel"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Resolver round-trips and latency when rendering mentions, per batch.
+
+Compares resolving each mention on its own (the post-processing approach)
+with MentionRenderer, which collects a batch's IDs and resolves them in one
+bulk call behind a TTL/LRU cache. A fixed per-call latency simulates a
+directory service.
+
+Usage:
+    python -m benchmarks.resolver_roundtrips [--documents N] [--batch B] [--latency-ms L]
+"""
+import argparse
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from slackformat.parsers.richtext_parser import iter_rich_text_events
+from slackformat.resolvers.base_resolver import MentionIds, MentionNames
+from slackformat.resolvers.dict_resolver import DictResolver
+from slackformat.resolvers.mention_renderer import MentionRenderer
+
+
+class SlowResolver(DictResolver):
+    """A DictResolver that sleeps for a fixed latency on every call."""
+
+    def __init__(self, latency: float, **directory: Dict[str, str]):
+        super().__init__(**directory)
+        self.latency = latency
+
+    def resolve(self, ids: MentionIds) -> MentionNames:
+        if self.latency:
+            time.sleep(self.latency)
+        return super().resolve(ids)
+
+
+def build_documents(count: int, users: int, channels: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        elements: List[Dict[str, Any]] = []
+        for _ in range(rng.randint(1, 6)):
+            if rng.random() < 0.7:
+                elements.append({"type": "user", "user_id": f"U{rng.randrange(users):05d}"})
+            else:
+                elements.append({"type": "channel", "channel_id": f"C{rng.randrange(channels):05d}"})
+            elements.append({"type": "text", "text": " said hi "})
+        documents.append({"type": "rich_text_section", "elements": elements})
+    return documents
+
+
+def _directory(users: int, channels: int) -> Dict[str, Dict[str, str]]:
+    return {
+        "users": {f"U{i:05d}": f"user{i}" for i in range(users)},
+        "channels": {f"C{i:05d}": f"channel{i}" for i in range(channels)},
+    }
+
+
+def naive_round_trips(documents: List[Dict[str, Any]], resolver: DictResolver) -> None:
+    """Resolve every mention with its own call, as per-output post-processing does."""
+    for document in documents:
+        for event in iter_rich_text_events(document):
+            if event.kind == "user":
+                resolver.resolve({"user": {event.attrs["user_id"]}})
+            elif event.kind == "channel":
+                resolver.resolve({"channel": {event.attrs["channel_id"]}})
+
+
+def run(documents: int = 2_000, batch: int = 200, users: int = 500, channels: int = 50,
+        latency: float = 0.001, seed: int = 0) -> List[Dict[str, Any]]:
+    corpus = build_documents(documents, users, channels, seed)
+    batches = [corpus[i:i + batch] for i in range(0, len(corpus), batch)]
+    results = []
+
+    naive = SlowResolver(latency, **_directory(users, channels))
+    start = time.perf_counter()
+    naive_round_trips(corpus, naive)
+    results.append({"strategy": "per-mention", "round_trips": naive.calls, "seconds": time.perf_counter() - start})
+
+    for label, warm in (("batched, cold cache", False), ("batched, warm cache", True)):
+        resolver = SlowResolver(latency, **_directory(users, channels))
+        renderer = MentionRenderer(resolver)
+        if warm:
+            for documents_batch in batches:
+                renderer.render_many(documents_batch)
+            resolver.calls = 0
+        start = time.perf_counter()
+        for documents_batch in batches:
+            renderer.render_many(documents_batch)
+        results.append({"strategy": label, "round_trips": resolver.calls, "seconds": time.perf_counter() - start})
+
+    for result in results:
+        result["per_batch"] = result["round_trips"] / len(batches)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--documents", type=int, default=2_000)
+    parser.add_argument("--batch", type=int, default=200)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--channels", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="simulated latency per resolver call")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    results = run(args.documents, args.batch, args.users, args.channels, args.latency_ms / 1000, args.seed)
+    print(f"# {args.documents:,} documents in batches of {args.batch}, {args.latency_ms} ms per resolver call")
+    print(f"{'strategy':<22} {'round-trips':>12} {'per batch':>10} {'seconds':>9}")
+    for result in results:
+        print(f"{result['strategy']:<22} {result['round_trips']:>12,} {result['per_batch']:>10.1f} {result['seconds']:>9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
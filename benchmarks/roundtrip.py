@@ -0,0 +1,200 @@
+"""
+Round-trip fidelity and throughput harness for the six conversion directions.
+
+Each direction is paired with the converter that undoes it. For every generated
+sample the forward hop is timed and the inverse hop is used to check whether the
+sample survives the round trip. The result is a matrix of fidelity percentage
+against forward ops/sec per direction.
+
+Usage:
+    python -m benchmarks.roundtrip [--samples N] [--seed S] [--no-hypothesis] [--json]
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from slackformat.core.base_converter import BaseConverter, payload_size
+from slackformat.converters.md_to_richtext import MdToRichtextConverter
+from slackformat.converters.richtext_to_blockkit import RichtextToBlockkitConverter
+from slackformat.converters.blockkit_to_richtext import BlockkitToRichtextConverter
+from slackformat.converters.blockkit_to_md import BlockkitToMdConverter
+from slackformat.converters.richtext_to_md import RichtextToMdConverter
+from slackformat.converters.md_to_blockkit import MdToBlockkitConverter
+from slackformat.parsers.richtext_parser import parse_rich_text_to_mrkdwn
+from slackformat.utils.merge_utils import merge_text_elements
+from benchmarks.corpus import generate_samples, hypothesis_available
+
+
+class Direction(NamedTuple):
+    name: str
+    source: str
+    forward: Callable[..., BaseConverter]
+    inverse: Callable[[Any], Any]
+    normalize: Callable[[Any], Any]
+
+
+class DirectionResult(NamedTuple):
+    direction: str
+    samples: int
+    roundtrips: int
+    errors: int
+    fidelity: float
+    ops_per_sec: float
+    mb_per_sec: float
+
+
+def normalize_markdown(text: Any) -> Any:
+    """Canonicalize Markdown by trimming lines and dropping blank ones."""
+    if not isinstance(text, str):
+        return text
+    return "\n".join(line.strip() for line in text.split("\n") if line.strip())
+
+
+def normalize_richtext(obj: Any) -> Any:
+    """Canonicalize a Rich Text tree so equivalent trees compare equal."""
+    if not isinstance(obj, dict):
+        return obj
+    obj_type = obj.get("type")
+    if obj_type == "rich_text":
+        children = [normalize_richtext(child) for child in obj.get("elements", [])]
+        children = [child for child in children if child.get("elements")]
+        if len(children) == 1:
+            return children[0]
+        return {"type": "rich_text", "elements": children}
+    if obj_type == "rich_text_section":
+        elements = [
+            {key: value for key, value in element.items() if key != "style" or value}
+            for element in obj.get("elements", [])
+        ]
+        return {"type": "rich_text_section", "elements": merge_text_elements(elements)}
+    if obj_type == "rich_text_list":
+        return {
+            "type": "rich_text_list",
+            "style": obj.get("style", "bullet"),
+            "elements": [normalize_richtext(child) for child in obj.get("elements", [])],
+        }
+    return obj
+
+
+def normalize_blockkit(obj: Any) -> Any:
+    """Canonicalize a Block Kit block, comparing mrkdwn text line by line."""
+    if isinstance(obj, dict) and obj.get("type") == "section":
+        text_obj = obj.get("text", {})
+        return {"type": "section", "text": {"type": text_obj.get("type"), "text": normalize_markdown(text_obj.get("text", ""))}}
+    return obj
+
+
+_inverse_converters = {
+    "richtext_to_blockkit": RichtextToBlockkitConverter(collect_stats=False),
+    "blockkit_to_richtext": BlockkitToRichtextConverter(collect_stats=False),
+    "blockkit_to_markdown": BlockkitToMdConverter(collect_stats=False),
+    "md_to_richtext": MdToRichtextConverter(collect_stats=False),
+    "md_to_blockkit": MdToBlockkitConverter(collect_stats=False),
+}
+
+DIRECTIONS: List[Direction] = [
+    Direction("md_to_richtext", "markdown", MdToRichtextConverter,
+              parse_rich_text_to_mrkdwn, normalize_markdown),
+    Direction("richtext_to_blockkit", "richtext", RichtextToBlockkitConverter,
+              _inverse_converters["blockkit_to_richtext"].convert, normalize_richtext),
+    Direction("blockkit_to_richtext", "blockkit", BlockkitToRichtextConverter,
+              _inverse_converters["richtext_to_blockkit"].convert, normalize_blockkit),
+    Direction("blockkit_to_markdown", "blockkit", BlockkitToMdConverter,
+              _inverse_converters["md_to_blockkit"].convert, normalize_blockkit),
+    Direction("richtext_to_markdown", "richtext", RichtextToMdConverter,
+              _inverse_converters["md_to_richtext"].convert, normalize_richtext),
+    Direction("md_to_blockkit", "markdown", MdToBlockkitConverter,
+              _inverse_converters["blockkit_to_markdown"].convert, normalize_markdown),
+]
+
+
+def run_direction(direction: Direction, samples: List[Any], repeat: int = 1) -> DirectionResult:
+    """Measure round-trip fidelity and forward throughput of one direction."""
+    converter = direction.forward(collect_stats=False)
+    roundtrips = errors = 0
+    for sample in samples:
+        try:
+            converted = converter.convert(sample)
+            restored = direction.inverse(converted)
+        except Exception:
+            errors += 1
+            continue
+        if direction.normalize(restored) == direction.normalize(sample):
+            roundtrips += 1
+
+    # Time the forward hop on its own so the inverse hop does not skew throughput.
+    bytes_in = sum(payload_size(sample) for sample in samples) * repeat
+    calls = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for sample in samples:
+            try:
+                converter.convert(sample)
+            except Exception:
+                pass
+            calls += 1
+    seconds = time.perf_counter() - start
+
+    count = len(samples)
+    fidelity = 100.0 * roundtrips / count if count else 0.0
+    ops_per_sec = calls / seconds if seconds else 0.0
+    mb_per_sec = bytes_in / seconds / 1_000_000 if seconds else 0.0
+    return DirectionResult(direction.name, count, roundtrips, errors, fidelity, ops_per_sec, mb_per_sec)
+
+
+def run_matrix(
+    samples: int = 500,
+    seed: int = 0,
+    use_hypothesis: Optional[bool] = None,
+    repeat: int = 3,
+    directions: Optional[List[str]] = None,
+) -> List[DirectionResult]:
+    """Run every (or the selected) direction over freshly generated samples."""
+    corpus: Dict[str, List[Any]] = {}
+    results = []
+    for direction in DIRECTIONS:
+        if directions and direction.name not in directions:
+            continue
+        if direction.source not in corpus:
+            corpus[direction.source] = generate_samples(direction.source, samples, seed, use_hypothesis)
+        results.append(run_direction(direction, corpus[direction.source], repeat))
+    return results
+
+
+def format_matrix(results: List[DirectionResult]) -> str:
+    """Render results as a fixed-width table."""
+    header = f"{'direction':<22} {'samples':>8} {'fidelity %':>11} {'errors':>7} {'ops/sec':>12} {'MB/s':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.direction:<22} {result.samples:>8} {result.fidelity:>11.1f} "
+            f"{result.errors:>7} {result.ops_per_sec:>12,.0f} {result.mb_per_sec:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=500, help="samples per source format")
+    parser.add_argument("--seed", type=int, default=0, help="generation seed")
+    parser.add_argument("--repeat", type=int, default=3, help="timing passes over the samples")
+    parser.add_argument("--direction", action="append", help="restrict to a direction (repeatable)")
+    parser.add_argument("--no-hypothesis", action="store_true", help="use the seeded fallback generator")
+    parser.add_argument("--json", action="store_true", help="emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    use_hypothesis = False if args.no_hypothesis else hypothesis_available()
+    results = run_matrix(args.samples, args.seed, use_hypothesis, args.repeat, args.direction)
+    if args.json:
+        print(json.dumps([result._asdict() for result in results], indent=2))
+    else:
+        generator = "hypothesis" if use_hypothesis else "seeded random"
+        print(f"# {args.samples} samples per format, seed={args.seed}, generator={generator}")
+        print(format_matrix(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
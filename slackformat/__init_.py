@@ -11,6 +11,19 @@ from .converters.blockkit_to_richtext import blockkit_to_richtext
 from .converters.blockkit_to_md import blockkit_to_markdown
 from .converters.richtext_to_md import richtext_to_markdown
 from .converters.md_to_blockkit import md_to_blockkit
+from .converters.message_converter import convert_message
+from .converters.blockkit_to_plain import blockkit_to_plain, extract_search_document, iter_search_documents
+
+# Converter classes
+from .core.base_converter import BaseConverter, ConverterStats
+from .converters.md_to_richtext import MdToRichtextConverter
+from .converters.richtext_to_blockkit import RichtextToBlockkitConverter
+from .converters.blockkit_to_richtext import BlockkitToRichtextConverter
+from .converters.blockkit_to_md import BlockkitToMdConverter
+from .converters.richtext_to_md import RichtextToMdConverter
+from .converters.md_to_blockkit import MdToBlockkitConverter
+from .converters.message_converter import MessageConverter
+from .converters.blockkit_to_plain import BlockkitToPlainConverter, SearchDocumentConverter, PlainTextDocument
 
 __all__ = [
     "md_to_richtext",
@@ -19,4 +32,20 @@ __all__ = [
     "blockkit_to_markdown",
     "richtext_to_markdown",
     "md_to_blockkit",
+    "convert_message",
+    "blockkit_to_plain",
+    "extract_search_document",
+    "iter_search_documents",
+    "BaseConverter",
+    "ConverterStats",
+    "MdToRichtextConverter",
+    "RichtextToBlockkitConverter",
+    "BlockkitToRichtextConverter",
+    "BlockkitToMdConverter",
+    "RichtextToMdConverter",
+    "MdToBlockkitConverter",
+    "MessageConverter",
+    "BlockkitToPlainConverter",
+    "SearchDocumentConverter",
+    "PlainTextDocument",
 ]
\ No newline at end of file
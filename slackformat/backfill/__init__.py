@@ -0,0 +1 @@
+# backfill/__init__.py
\ No newline at end of file
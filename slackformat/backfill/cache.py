@@ -0,0 +1,121 @@
+import hashlib
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# SQLite builds may cap bound parameters at 999, so lookups are chunked.
+_MAX_PARAMS = 900
+
+def content_key(data: Any, namespace: str = "") -> str:
+    """Return a stable hash of `data` (any JSON-serializable value) within `namespace`."""
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(namespace.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+class ConversionCache:
+    """
+    A persistent SQLite store mapping content hashes to converted output, plus
+    named checkpoints recording how far a backfill job has progressed.
+
+    A cache instance owns one SQLite connection and must not be shared across
+    threads; open one cache per worker instead.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS conversions (key TEXT PRIMARY KEY, output TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints (job TEXT PRIMARY KEY, offset INTEGER NOT NULL)"
+        )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the cached outputs for whichever of `keys` are present."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        for start in range(0, len(keys), _MAX_PARAMS):
+            chunk = keys[start:start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, output FROM conversions WHERE key IN ({placeholders})", chunk
+            )
+            for key, output in rows:
+                found[key] = json.loads(output)
+        return found
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached output for `key`, or None."""
+        return self.get_many([key]).get(key)
+
+    def write_batch(
+        self,
+        entries: Iterable[Tuple[str, Any]],
+        job: Optional[str] = None,
+        offset: Optional[int] = None,
+    ) -> None:
+        """
+        Store `(key, output)` entries and, optionally, advance `job`'s checkpoint
+        to `offset`, all in a single transaction.
+        """
+        rows = [(key, json.dumps(output, ensure_ascii=False)) for key, output in entries]
+        with self._transaction():
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO conversions (key, output) VALUES (?, ?)", rows
+                )
+            if job is not None and offset is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO checkpoints (job, offset) VALUES (?, ?)", (job, offset)
+                )
+
+    def put(self, key: str, output: Any) -> None:
+        """Store a single converted output."""
+        self.write_batch([(key, output)])
+
+    def get_checkpoint(self, job: str) -> int:
+        """Return the number of inputs `job` has fully processed (0 if never run)."""
+        row = self._conn.execute("SELECT offset FROM checkpoints WHERE job = ?", (job,)).fetchone()
+        return row[0] if row else 0
+
+    def set_checkpoint(self, job: str, offset: int) -> None:
+        """Record that `job` has fully processed the first `offset` inputs."""
+        self.write_batch([], job=job, offset=offset)
+
+    def clear_checkpoint(self, job: str) -> None:
+        """Forget `job`'s progress so the next run starts from the beginning."""
+        with self._transaction():
+            self._conn.execute("DELETE FROM checkpoints WHERE job = ?", (job,))
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM conversions").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ConversionCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+class _Transaction:
+    """Wraps statements in BEGIN/COMMIT, rolling back on error."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> None:
+        self._conn.execute("BEGIN")
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
\ No newline at end of file
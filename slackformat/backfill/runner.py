@@ -0,0 +1,122 @@
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from ..__init_ import __version__
+from ..core.base_converter import BaseConverter
+from ..converters.blockkit_to_md import convert_blockkit_blocks_to_markdown
+from .cache import ConversionCache, content_key
+
+# Bump whenever a converter's output changes without a package version bump,
+# so outputs cached by earlier code are no longer served.
+CACHE_SCHEMA = "2"
+
+class BackfillStats(NamedTuple):
+    """Counters for a backfill run."""
+    processed: int
+    cache_hits: int
+    converted: int
+    resumed_from: int
+
+class BackfillRunner:
+    """
+    Converts a large, ordered stream of inputs (by default, lists of Block Kit
+    blocks to Markdown) with a persistent content-addressed cache and resumable
+    checkpoints.
+
+    Inputs are processed in batches. Each batch does one cache lookup, converts
+    only inputs whose content has never been seen, and commits the new cache
+    entries together with the advanced checkpoint in one transaction once the
+    caller has consumed the batch's results. A rerun of the same `job` skips
+    the inputs already covered by its checkpoint, so the input stream must be
+    replayed in the same order.
+
+    The default cache namespace combines the converter's cache identity (its
+    qualified name and, for BaseConverter instances, every output-affecting
+    option) with the package version and CACHE_SCHEMA, so neither a different
+    configuration nor a library upgrade is served another converter's outputs.
+    Lambdas, partials and local functions have no stable name and require an
+    explicit `namespace`.
+    """
+
+    def __init__(
+        self,
+        cache: Union[ConversionCache, str],
+        job: str = "default",
+        converter: Union[BaseConverter, Callable[[Any], Any]] = convert_blockkit_blocks_to_markdown,
+        namespace: Optional[str] = None,
+        batch_size: int = 500,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.cache = ConversionCache(cache) if isinstance(cache, str) else cache
+        self.job = job
+        self._convert = converter.convert if isinstance(converter, BaseConverter) else converter
+        self.namespace = namespace if namespace is not None else _converter_name(converter)
+        self.batch_size = batch_size
+        self._processed = self._hits = self._converted = self._resumed_from = 0
+
+    @property
+    def stats(self) -> BackfillStats:
+        return BackfillStats(self._processed, self._hits, self._converted, self._resumed_from)
+
+    def run(self, inputs: Iterable[Any]) -> Iterator[Tuple[int, Any]]:
+        """
+        Yields `(offset, output)` for every input not yet covered by this job's
+        checkpoint, where `offset` is the input's zero-based position in `inputs`.
+        """
+        start = self.cache.get_checkpoint(self.job)
+        self._resumed_from = start
+        offset = start
+        remaining = islice(iter(inputs), start, None)
+
+        while True:
+            batch = list(islice(remaining, self.batch_size))
+            if not batch:
+                break
+            outputs, new_entries = self._convert_batch(batch)
+            for i, output in enumerate(outputs):
+                yield offset + i, output
+            offset += len(batch)
+            self.cache.write_batch(new_entries.items(), job=self.job, offset=offset)
+
+    def run_all(self, inputs: Iterable[Any], sink: Callable[[int, Any], None]) -> BackfillStats:
+        """Runs the backfill to completion, passing each result to `sink`."""
+        for offset, output in self.run(inputs):
+            sink(offset, output)
+        return self.stats
+
+    def reset(self) -> None:
+        """Clears this job's checkpoint; cached conversions are kept."""
+        self.cache.clear_checkpoint(self.job)
+
+    def _convert_batch(self, batch: List[Any]) -> Tuple[List[Any], Dict[str, Any]]:
+        keys = [content_key(item, self.namespace) for item in batch]
+        known = self.cache.get_many(keys)
+        new_entries: Dict[str, Any] = {}
+        outputs = []
+        for key, item in zip(keys, batch):
+            if key in known:
+                self._hits += 1
+                output = known[key]
+            elif key in new_entries:
+                # Duplicate of an input converted earlier in this batch
+                self._hits += 1
+                output = new_entries[key]
+            else:
+                self._converted += 1
+                output = self._convert(item)
+                new_entries[key] = output
+            outputs.append(output)
+        self._processed += len(batch)
+        return outputs, new_entries
+
+def _converter_name(converter: Any) -> str:
+    if isinstance(converter, BaseConverter):
+        name = converter.cache_identity()
+    else:
+        qualname = getattr(converter, "__qualname__", None)
+        if not qualname or "<" in qualname:
+            raise ValueError(
+                f"cannot derive a stable cache namespace for {converter!r}; pass namespace= explicitly"
+            )
+        name = f"{converter.__module__}.{qualname}"
+    return f"{name}@{__version__}/{CACHE_SCHEMA}"
\ No newline at end of file
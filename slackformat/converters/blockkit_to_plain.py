@@ -0,0 +1,157 @@
+import re
+from typing import Dict, Any, List, NamedTuple, Optional, Union, Iterable, Iterator
+from ..core.base_converter import BaseConverter
+from .md_to_richtext import MdToRichtextConverter
+from ..parsers.blockkit_parser import extract_text_from_block
+from ..formatters.plain_formatter import PlainTextCollector
+
+Blocks = Union[Dict[str, Any], List[Dict[str, Any]]]
+
+class PlainTextDocument(NamedTuple):
+    """Unstyled text of a message plus its search terms and referenced entities."""
+    text: str
+    tokens: List[str]
+    users: List[str]
+    channels: List[str]
+    usergroups: List[str]
+    links: List[str]
+    emoji: List[str]
+
+class _PlainBlockWalker:
+    """Feeds Block Kit blocks into a PlainTextCollector."""
+
+    def __init__(self, md_converter: MdToRichtextConverter):
+        self.md_converter = md_converter
+
+    def add_blocks(self, collector: PlainTextCollector, blocks: Blocks) -> None:
+        if isinstance(blocks, dict):
+            blocks = [blocks]
+        for block in blocks or []:
+            self.add_block(collector, block)
+
+    def add_block(
+        self,
+        collector: PlainTextCollector,
+        block: Dict[str, Any],
+        section_text: Optional[Dict[str, Any]] = None,
+        context_texts: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Adds one block. `section_text` may carry the rich text already parsed
+        from a mrkdwn section's text, and `context_texts` the rich text parsed
+        from each of a context's elements, so callers that need it too parse
+        it once.
+        """
+        block_type = block.get("type", "")
+        if block_type == "section":
+            if section_text is not None:
+                collector.add_rich_text(section_text)
+            else:
+                self.add_text_object(collector, block.get("text"))
+            for field in block.get("fields") or []:
+                self.add_text_object(collector, field)
+        elif block_type == "header":
+            self.add_text_object(collector, block.get("text"))
+        elif block_type == "context":
+            elements = block.get("elements") or []
+            for i, element in enumerate(elements):
+                if element.get("type") == "mrkdwn" and context_texts is not None:
+                    collector.add_rich_text(context_texts[i])
+                elif element.get("type") in ("mrkdwn", "plain_text"):
+                    self.add_text_object(collector, element)
+        elif block_type == "image":
+            collector.add_text(extract_text_from_block(block.get("title")) or block.get("alt_text", ""))
+        elif block_type == "rich_text":
+            collector.add_rich_text(block)
+        elif block_type != "divider":
+            collector.add_text(extract_text_from_block(block))
+
+    def add_text_object(self, collector: PlainTextCollector, text_obj: Optional[Dict[str, Any]]) -> None:
+        if not text_obj:
+            return
+        if text_obj.get("type") == "mrkdwn":
+            collector.add_rich_text(self.md_converter.convert(text_obj.get("text", "")))
+        else:
+            collector.add_text(text_obj.get("text", ""))
+
+class BlockkitToPlainConverter(BaseConverter):
+    """Converts a Block Kit block, or a list of blocks, to unstyled text."""
+
+    def __init__(self, md_converter: Optional[MdToRichtextConverter] = None, collect_stats: bool = True):
+        super().__init__(collect_stats=collect_stats)
+        self._walker = _PlainBlockWalker(md_converter or MdToRichtextConverter(collect_stats=False))
+
+    def _identity_options(self) -> Dict[str, Any]:
+        return {"md_converter": self._walker.md_converter}
+
+    def _convert(self, blocks: Blocks) -> str:
+        collector = PlainTextCollector()
+        self._walker.add_blocks(collector, blocks)
+        return collector.text()
+
+class SearchDocumentConverter(BaseConverter):
+    """
+    Converts Block Kit blocks to PlainTextDocuments for search indexing.
+
+    Text, tokens and entities are all produced from one walk over the blocks.
+    Use `iter_convert` to stream documents from a large archive.
+    """
+
+    _TOKEN = re.compile(r"\w+")
+
+    def __init__(
+        self,
+        tokenize: bool = True,
+        entities: bool = True,
+        lowercase: bool = True,
+        md_converter: Optional[MdToRichtextConverter] = None,
+        collect_stats: bool = True,
+    ):
+        super().__init__(collect_stats=collect_stats)
+        self._tokenize = tokenize
+        self._entities = entities
+        self._lowercase = lowercase
+        self._walker = _PlainBlockWalker(md_converter or MdToRichtextConverter(collect_stats=False))
+
+    def _identity_options(self) -> Dict[str, Any]:
+        return {
+            "tokenize": self._tokenize,
+            "entities": self._entities,
+            "lowercase": self._lowercase,
+            "md_converter": self._walker.md_converter,
+        }
+
+    def _convert(self, blocks: Blocks) -> PlainTextDocument:
+        collector = PlainTextCollector(collect_entities=self._entities)
+        self._walker.add_blocks(collector, blocks)
+        text = collector.text()
+
+        tokens: List[str] = []
+        if self._tokenize:
+            tokens = self._TOKEN.findall(text.lower() if self._lowercase else text)
+
+        found = collector.entities
+        return PlainTextDocument(
+            text=text,
+            tokens=tokens,
+            users=list(found["user"]),
+            channels=list(found["channel"]),
+            usergroups=list(found["usergroup"]),
+            links=list(found["link"]),
+            emoji=list(found["emoji"]),
+        )
+
+_default_converter = BlockkitToPlainConverter(collect_stats=False)
+_default_search_converter = SearchDocumentConverter(collect_stats=False)
+
+def blockkit_to_plain(blocks: Blocks) -> str:
+    """Converts a Block Kit block, or a list of blocks, to unstyled text."""
+    return _default_converter.convert(blocks)
+
+def extract_search_document(blocks: Blocks) -> PlainTextDocument:
+    """Extracts unstyled text, lowercase tokens and entity IDs from Block Kit blocks."""
+    return _default_search_converter.convert(blocks)
+
+def iter_search_documents(messages: Iterable[Blocks]) -> Iterator[PlainTextDocument]:
+    """Lazily extracts a PlainTextDocument from each message's blocks."""
+    return _default_search_converter.iter_convert(messages)
\ No newline at end of file
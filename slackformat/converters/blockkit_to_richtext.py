@@ -1,39 +1,75 @@
-from typing import Dict, Any, List
-from .md_to_richtext import md_to_richtext
+from typing import Dict, Any, List, Optional, Union
+from ..core.base_converter import BaseConverter
+from .md_to_richtext import MdToRichtextConverter
 from ..parsers.blockkit_parser import extract_text_from_block
+from ..utils.intern_utils import Interner, resolve_interner
+
+class BlockkitToRichtextConverter(BaseConverter):
+    """Converts Block Kit blocks to Slack Rich Text objects."""
+
+    def __init__(
+        self,
+        md_converter: Optional[MdToRichtextConverter] = None,
+        intern: Union[bool, Interner] = False,
+        collect_stats: bool = True,
+    ):
+        super().__init__(collect_stats=collect_stats)
+        self._md_converter = md_converter or MdToRichtextConverter(collect_stats=False)
+        self._interner = resolve_interner(intern)
+
+    @property
+    def md_converter(self) -> MdToRichtextConverter:
+        return self._md_converter
+
+    def _identity_options(self) -> Dict[str, Any]:
+        return {"md_converter": self._md_converter, "intern": self._interner is not None}
+
+    def _convert(self, blockkit_obj: dict) -> dict:
+        return self._intern(self._convert_block(blockkit_obj))
+
+    def _intern(self, result: dict) -> dict:
+        return self._interner.intern(result) if self._interner is not None else result
+
+    def _parse_context(self, elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Parses each context element's text as mrkdwn, in order."""
+        return [self._md_converter.convert(extract_text_from_block(elem)) for elem in elements]
+
+    def _convert_block(self, blockkit_obj: dict) -> dict:
+        if not blockkit_obj:
+            return {"type": "rich_text_section", "elements": []}
+
+        block_type = blockkit_obj.get("type", "")
+
+        if block_type == "rich_text":
+            return blockkit_obj
+
+        text_content = ""
+        if block_type == "section":
+            text_obj = blockkit_obj.get("text", {})
+            if text_obj.get("type") == "mrkdwn":
+                # If it's markdown, convert it fully
+                return self._md_converter.convert(text_obj.get("text", ""))
+            else:
+                text_content = text_obj.get("text", "")
+        elif block_type == "header":
+            text_content = extract_text_from_block(blockkit_obj.get("text"))
+            return {
+                "type": "rich_text_section",
+                "elements": [{"type": "text", "text": text_content, "style": {"bold": True}}]
+            }
+        elif block_type == "context":
+            return _context_section(self._parse_context(blockkit_obj.get("elements", [])))
+        else:
+            text_content = extract_text_from_block(blockkit_obj)
+
+        return {"type": "rich_text_section", "elements": [{"type": "text", "text": text_content}]}
+
+def _context_section(parsed: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Joins the rich text parsed from each context element into one section."""
+    return {"type": "rich_text_section", "elements": [elem for rt_obj in parsed for elem in rt_obj.get("elements", [])]}
+
+_default_converter = BlockkitToRichtextConverter(collect_stats=False)
 
 def blockkit_to_richtext(blockkit_obj: dict) -> dict:
     """Converts a single Block Kit block to a Slack Rich Text object."""
-    if not blockkit_obj:
-        return {"type": "rich_text_section", "elements": []}
-
-    block_type = blockkit_obj.get("type", "")
-
-    if block_type == "rich_text":
-        return blockkit_obj
-    
-    text_content = ""
-    if block_type == "section":
-        text_obj = blockkit_obj.get("text", {})
-        if text_obj.get("type") == "mrkdwn":
-            # If it's markdown, convert it fully
-            return md_to_richtext(text_obj.get("text", ""))
-        else:
-            text_content = text_obj.get("text", "")
-    elif block_type == "header":
-        text_content = extract_text_from_block(blockkit_obj.get("text"))
-        return {
-            "type": "rich_text_section",
-            "elements": [{"type": "text", "text": text_content, "style": {"bold": True}}]
-        }
-    elif block_type == "context":
-        elements = blockkit_obj.get("elements", [])
-        all_elements = []
-        for elem in elements:
-            rt_obj = md_to_richtext(extract_text_from_block(elem))
-            all_elements.extend(rt_obj.get("elements", []))
-        return {"type": "rich_text_section", "elements": all_elements}
-    else:
-        text_content = extract_text_from_block(blockkit_obj)
-
-    return {"type": "rich_text_section", "elements": [{"type": "text", "text": text_content}]}
\ No newline at end of file
+    return _default_converter.convert(blockkit_obj)
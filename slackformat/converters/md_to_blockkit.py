@@ -1,19 +1,44 @@
-from typing import Dict, Any
-from .md_to_richtext import md_to_richtext
-from .richtext_to_blockkit import richtext_to_blockkit
+from typing import Dict, Any, Optional
+from ..core.base_converter import BaseConverter
+from .md_to_richtext import MdToRichtextConverter
+from .richtext_to_blockkit import RichtextToBlockkitConverter
+
+class MdToBlockkitConverter(BaseConverter):
+    """
+    Converts Markdown strings directly to Block Kit objects.
+    This chains an MdToRichtextConverter and a RichtextToBlockkitConverter.
+    """
+
+    def __init__(
+        self,
+        md_converter: Optional[MdToRichtextConverter] = None,
+        blockkit_converter: Optional[RichtextToBlockkitConverter] = None,
+        collect_stats: bool = True,
+    ):
+        super().__init__(collect_stats=collect_stats)
+        self._md_converter = md_converter or MdToRichtextConverter(collect_stats=False)
+        self._blockkit_converter = blockkit_converter or RichtextToBlockkitConverter(collect_stats=False)
+
+    def _identity_options(self) -> Dict[str, Any]:
+        return {"md_converter": self._md_converter, "blockkit_converter": self._blockkit_converter}
+
+    def _convert(self, md_text: str) -> Dict[str, Any]:
+        if not md_text:
+            return {"type": "section", "text": {"type": "mrkdwn", "text": ""}}
+
+        # Step 1: Convert Markdown to Rich Text
+        rich_text_obj = self._md_converter.convert(md_text)
+
+        # Step 2: Convert Rich Text to Block Kit
+        blockkit_obj = self._blockkit_converter.convert(rich_text_obj)
+
+        return blockkit_obj
+
+_default_converter = MdToBlockkitConverter(collect_stats=False)
 
 def md_to_blockkit(md_text: str) -> Dict[str, Any]:
     """
     Converts a Markdown string directly to a Block Kit object.
     This is a convenience function that chains md_to_richtext and richtext_to_blockkit.
     """
-    if not md_text:
-        return {"type": "section", "text": {"type": "mrkdwn", "text": ""}}
-        
-    # Step 1: Convert Markdown to Rich Text
-    rich_text_obj = md_to_richtext(md_text)
-    
-    # Step 2: Convert Rich Text to Block Kit
-    blockkit_obj = richtext_to_blockkit(rich_text_obj)
-    
-    return blockkit_obj
\ No newline at end of file
+    return _default_converter.convert(md_text)
@@ -1,24 +1,124 @@
-import re
-from typing import Dict, List, Any
-from ..parsers.markdown_parser import parse_markdown_to_elements
+import atexit
+import os
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Union
+from ..core.base_converter import BaseConverter
+from ..parsers.markdown_parser import parse_markdown_to_elements, LIST_ITEM_PATTERN, ORDERED_ITEM_PATTERN
+from ..utils.intern_utils import Interner, resolve_interner
 
-def md_to_richtext(md_text: str) -> Dict[str, Any]:
-    """Converts a Slack Markdown string to a Slack Rich Text object."""
-    if not md_text:
+# Input size, in characters, from which an opted-in converter parses in
+# parallel. Below about a megabyte, pool start-up and pickling cost more than
+# the parse itself.
+DEFAULT_PARALLEL_THRESHOLD = 1_000_000
+
+class MdToRichtextConverter(BaseConverter):
+    """Converts Slack Markdown strings to Slack Rich Text objects."""
+
+    def __init__(
+        self,
+        intern: Union[bool, Interner] = False,
+        parallel: bool = False,
+        parallel_threshold: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        collect_stats: bool = True,
+    ):
+        """
+        Args:
+            intern: If True (or an Interner), return hash-consed read-only trees
+                whose identical subtrees are shared, to save memory on large
+                archives. True uses the process-wide default interner.
+            parallel: Opt in to parsing large inputs concurrently: inputs of at
+                least `parallel_threshold` characters are split at line
+                boundaries and the chunks parsed in a pool. Off by default.
+            parallel_threshold: The size from which to parse in parallel;
+                defaults to DEFAULT_PARALLEL_THRESHOLD when `parallel` is set.
+                Passing a threshold opts in as well.
+            max_workers: Worker count for the pool created on first large input
+                (defaults to the CPU count). That pool is shut down by close(),
+                or at interpreter exit.
+            executor: An existing executor to parse chunks with instead of
+                creating a pool. Process pools are used by default, or threads
+                on free-threaded Python builds.
+            collect_stats: Whether to record usage statistics.
+        """
+        super().__init__(collect_stats=collect_stats)
+        self._interner = resolve_interner(intern)
+        if parallel_threshold is None and parallel:
+            parallel_threshold = DEFAULT_PARALLEL_THRESHOLD
+        self._parallel_threshold = parallel_threshold
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor = executor
+        self._owns_executor = False
+        self._executor_lock = threading.Lock()
+
+    def _identity_options(self) -> Dict[str, Any]:
+        return {"intern": self._interner is not None}
+
+    def _convert(self, md_text: str) -> Dict[str, Any]:
+        result = self._parse(md_text)
+        return self._interner.intern(result) if self._interner is not None else result
+
+    def _parse(self, md_text: str) -> Dict[str, Any]:
+        if not md_text:
+            return {"type": "rich_text_section", "elements": []}
+
+        if self._use_parallel(md_text):
+            chunks = _split_at_lines(md_text, self._max_workers * 4)
+            sections = []
+            for chunk_sections in self._get_executor().map(_parse_markdown_sections, chunks):
+                sections.extend(chunk_sections)
+        else:
+            sections = _parse_markdown_sections(md_text)
+
+        if len(sections) > 1:
+            return {"type": "rich_text", "elements": sections}
+        if len(sections) == 1:
+            return sections[0]
         return {"type": "rich_text_section", "elements": []}
 
-    lines = md_text.split('\n')
+    def _use_parallel(self, md_text: str) -> bool:
+        if self._parallel_threshold is None or len(md_text) < self._parallel_threshold:
+            return False
+        # A single worker of our own would only add chunking and pickling overhead
+        return self._executor is not None or self._max_workers > 1
+
+    def close(self) -> None:
+        """Shuts down the worker pool if this converter created one."""
+        with self._executor_lock:
+            if self._owns_executor and self._executor is not None:
+                atexit.unregister(self._executor.shutdown)
+                self._executor.shutdown()
+                self._executor = None
+                self._owns_executor = False
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+                    pool = ProcessPoolExecutor if gil_enabled else ThreadPoolExecutor
+                    self._executor = pool(max_workers=self._max_workers)
+                    self._owns_executor = True
+                    atexit.register(self._executor.shutdown)
+        return self._executor
+
+def _parse_markdown_sections(md_text: str) -> List[Dict[str, Any]]:
+    """Parses Markdown line by line into top-level rich text sections and lists."""
     sections = []
 
-    for line in lines:
+    for line in md_text.split('\n'):
         stripped_line = line.strip()
         if not stripped_line:
             continue
 
         # Basic list detection
-        if re.match(r'^([•*-]|\d+\.)\s+', stripped_line):
-            style = "ordered" if re.match(r'^\d+\.\s+', stripped_line) else "bullet"
-            content = re.sub(r'^([•*-]|\d+\.)\s+', '', stripped_line)
+        marker = LIST_ITEM_PATTERN.match(stripped_line)
+        if marker:
+            style = "ordered" if ORDERED_ITEM_PATTERN.match(stripped_line) else "bullet"
+            content = stripped_line[marker.end():]
             elements = parse_markdown_to_elements(content)
             sections.append({
                 "type": "rich_text_list",
@@ -28,9 +128,25 @@ def md_to_richtext(md_text: str) -> Dict[str, Any]:
         else:
             elements = parse_markdown_to_elements(stripped_line)
             sections.append({"type": "rich_text_section", "elements": elements})
-    
-    if len(sections) > 1:
-        return {"type": "rich_text", "elements": sections}
-    if len(sections) == 1:
-        return sections[0]
-    return {"type": "rich_text_section", "elements": []}
\ No newline at end of file
+
+    return sections
+
+def _split_at_lines(text: str, parts: int) -> List[str]:
+    """Splits text into about `parts` chunks, cutting only at newlines."""
+    size = max(len(text) // parts, 1)
+    chunks = []
+    start = 0
+    while start < len(text):
+        cut = text.find('\n', start + size)
+        if cut == -1:
+            chunks.append(text[start:])
+            break
+        chunks.append(text[start:cut])
+        start = cut + 1
+    return chunks
+
+_default_converter = MdToRichtextConverter(collect_stats=False)
+
+def md_to_richtext(md_text: str) -> Dict[str, Any]:
+    """Converts a Slack Markdown string to a Slack Rich Text object."""
+    return _default_converter.convert(md_text)
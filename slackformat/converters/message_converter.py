@@ -0,0 +1,147 @@
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from ..core.base_converter import BaseConverter
+from .blockkit_to_md import BlockkitToMdConverter
+from .blockkit_to_richtext import BlockkitToRichtextConverter, _context_section
+from .blockkit_to_plain import _PlainBlockWalker
+from ..formatters.plain_formatter import PlainTextCollector
+from ..utils.escape_utils import escape_mrkdwn
+
+MESSAGE_TARGETS = ("markdown", "richtext", "plain")
+
+class MessageConverter(BaseConverter):
+    """
+    Converts a whole Slack message payload (text, blocks and attachments) to
+    several output formats in one walk over the payload.
+
+    Each block is parsed at most once: the rich text parsed from a mrkdwn
+    section or context serves both the richtext and plain targets, and
+    rich_text blocks are used as they are. Markdown passes mrkdwn through unparsed. Plain text
+    matches blockkit_to_plain.
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[str] = MESSAGE_TARGETS,
+        markdown_converter: Optional[BlockkitToMdConverter] = None,
+        richtext_converter: Optional[BlockkitToRichtextConverter] = None,
+        collect_stats: bool = True,
+    ):
+        super().__init__(collect_stats=collect_stats)
+        unknown = [target for target in targets if target not in MESSAGE_TARGETS]
+        if unknown:
+            raise ValueError(f"Unknown message targets: {unknown}; expected a subset of {MESSAGE_TARGETS}")
+        self._targets: Tuple[str, ...] = tuple(targets)
+        self._want_md = "markdown" in self._targets
+        self._want_rt = "richtext" in self._targets
+        self._want_plain = "plain" in self._targets
+        self._markdown_converter = markdown_converter or BlockkitToMdConverter(collect_stats=False)
+        self._richtext_converter = richtext_converter or BlockkitToRichtextConverter(collect_stats=False)
+        # Plain text parses mrkdwn with the same parser the richtext target uses
+        self._plain_walker = _PlainBlockWalker(self._richtext_converter.md_converter)
+
+    def _identity_options(self) -> Dict[str, Any]:
+        return {
+            "targets": self._targets,
+            "markdown_converter": self._markdown_converter,
+            "richtext_converter": self._richtext_converter,
+        }
+
+    @property
+    def targets(self) -> Tuple[str, ...]:
+        return self._targets
+
+    def _convert(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        md_parts: List[str] = []
+        rt_sections: List[Dict[str, Any]] = []
+        plain = PlainTextCollector()
+
+        for block in _iter_message_blocks(payload or {}):
+            if self._want_md:
+                md_parts.append(self._markdown_converter.convert(block))
+            richtext = context_texts = None
+            if self._want_rt and self._want_plain and block.get("type") == "context":
+                context_texts = self._richtext_converter._parse_context(block.get("elements") or [])
+                richtext = self._richtext_converter._intern(_context_section(context_texts))
+            elif self._want_rt or (self._want_plain and _is_mrkdwn_section(block)):
+                richtext = self._richtext_converter.convert(block)
+            if self._want_rt:
+                if richtext.get("type") == "rich_text":
+                    rt_sections.extend(richtext.get("elements", []))
+                elif _has_content(richtext):
+                    rt_sections.append(richtext)
+            if self._want_plain:
+                section_text = richtext if _is_mrkdwn_section(block) else None
+                self._plain_walker.add_block(plain, block, section_text, context_texts)
+
+        result: Dict[str, Any] = {}
+        if self._want_md:
+            result["markdown"] = "\n\n".join(filter(None, md_parts))
+        if self._want_rt:
+            result["richtext"] = {"type": "rich_text", "elements": rt_sections}
+        if self._want_plain:
+            result["plain"] = plain.text()
+        return result
+
+def _is_mrkdwn_section(block: Dict[str, Any]) -> bool:
+    return block.get("type") == "section" and (block.get("text") or {}).get("type") == "mrkdwn"
+
+def _has_content(section: Dict[str, Any]) -> bool:
+    return any(elem.get("type") != "text" or elem.get("text") for elem in section.get("elements", []))
+
+def _mrkdwn_section(text: str) -> Dict[str, Any]:
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+def _iter_message_blocks(payload: Dict[str, Any]):
+    """Yields the message's blocks followed by each attachment's content as blocks."""
+    blocks = payload.get("blocks")
+    if blocks:
+        yield from blocks
+    elif payload.get("text"):
+        yield _mrkdwn_section(payload["text"])
+
+    for attachment in payload.get("attachments") or []:
+        yield from _iter_attachment_blocks(attachment)
+
+def _iter_attachment_blocks(attachment: Dict[str, Any]):
+    """Yields an attachment's legacy fields and blocks as Block Kit blocks."""
+    emitted = False
+    if attachment.get("pretext"):
+        emitted = True
+        yield _mrkdwn_section(attachment["pretext"])
+    if attachment.get("title"):
+        emitted = True
+        title = escape_mrkdwn(attachment["title"])
+        link = attachment.get("title_link")
+        yield _mrkdwn_section(f"<{link}|{title}>" if link else f"*{title}*")
+    if attachment.get("text"):
+        emitted = True
+        yield _mrkdwn_section(attachment["text"])
+    for field in attachment.get("fields") or []:
+        emitted = True
+        title = escape_mrkdwn(field.get("title"))
+        value = field.get("value", "")
+        yield _mrkdwn_section(f"*{title}*\n{value}" if title else value)
+    for block in attachment.get("blocks") or []:
+        emitted = True
+        yield block
+    if not emitted and attachment.get("fallback"):
+        yield {"type": "section", "text": {"type": "plain_text", "text": attachment["fallback"]}}
+
+_default_converters: Dict[Tuple[str, ...], MessageConverter] = {}
+
+def convert_message(payload: Dict[str, Any], targets: Sequence[str] = MESSAGE_TARGETS) -> Dict[str, Any]:
+    """
+    Converts a Slack message payload to each requested format in a single pass.
+
+    Args:
+        payload: A Slack `message` event payload with `text`, `blocks` and/or `attachments`.
+        targets: Output formats to produce: any of "markdown", "richtext" and "plain".
+
+    Returns:
+        A dict mapping each requested target to its output.
+    """
+    key = tuple(targets)
+    converter = _default_converters.get(key)
+    if converter is None:
+        converter = _default_converters.setdefault(key, MessageConverter(key, collect_stats=False))
+    return converter.convert(payload)
\ No newline at end of file
@@ -1,17 +1,26 @@
 from typing import Dict
+from ..core.base_converter import BaseConverter
 from ..parsers.richtext_parser import parse_rich_text_to_mrkdwn
 
-def richtext_to_blockkit(richtext_obj: dict) -> dict:
-    """Converts a Slack Rich Text object to a Block Kit section."""
-    if not richtext_obj:
-        return {"type": "section", "text": {"type": "mrkdwn", "text": ""}}
+class RichtextToBlockkitConverter(BaseConverter):
+    """Converts Slack Rich Text objects to Block Kit sections."""
+
+    def _convert(self, richtext_obj: dict) -> dict:
+        if not richtext_obj:
+            return {"type": "section", "text": {"type": "mrkdwn", "text": ""}}
+
+        markdown_text = parse_rich_text_to_mrkdwn(richtext_obj)
 
-    markdown_text = parse_rich_text_to_mrkdwn(richtext_obj)
-    
-    return {
-        "type": "section",
-        "text": {
-            "type": "mrkdwn",
-            "text": markdown_text
+        return {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": markdown_text
+            }
         }
-    }
\ No newline at end of file
+
+_default_converter = RichtextToBlockkitConverter(collect_stats=False)
+
+def richtext_to_blockkit(richtext_obj: dict) -> dict:
+    """Converts a Slack Rich Text object to a Block Kit section."""
+    return _default_converter.convert(richtext_obj)
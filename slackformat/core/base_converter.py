@@ -1,11 +1,82 @@
+import itertools
+import json
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple
+
+
+class ConverterStats(NamedTuple):
+    """A point-in-time snapshot of a converter's usage counters."""
+    calls: int
+    bytes_in: int
+    bytes_out: int
+    seconds: float
+
+
+def payload_size(data: Any) -> int:
+    """
+    Return the UTF-8 size of a payload, serializing structured data as compact
+    JSON. Data that cannot be serialized counts as 0 bytes; this never raises.
+    """
+    if data is None:
+        return 0
+    if isinstance(data, str):
+        return len(data.encode("utf-8", "surrogatepass"))
+    try:
+        serialized = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+    except Exception:
+        return 0
+    return len(serialized.encode("utf-8", "surrogatepass"))
+
+
+def _option_identity(value: Any) -> str:
+    if isinstance(value, BaseConverter):
+        return value.cache_identity()
+    return repr(value)
+
+
+class _ThreadToken:
+    """Lives only in a thread's local storage, so it is collected when the thread exits."""
+    __slots__ = ("__weakref__",)
+
+
+def _retire_counter(converter_ref: "weakref.ref[BaseConverter]", key: int) -> None:
+    converter = converter_ref()
+    if converter is not None:
+        converter._retire_counter(key)
+
 
 class BaseConverter(ABC):
-    """Abstract base class for all format converters."""
+    """
+    Abstract base class for all format converters.
+
+    Subclasses implement `_convert` and keep their configuration read-only after
+    `__init__`, so a single instance can be shared freely between threads. Usage
+    statistics are accumulated in per-thread counters, which keeps the hot path
+    free of locks; `stats()` sums them on demand. When a thread exits, its
+    counter is folded into a shared total, so the number of counters is
+    bounded by the number of live threads.
+
+    Sizing inputs and outputs costs a JSON serialization per call, so the
+    module-level conversion functions use instances with statistics disabled.
+    """
+
+    def __init__(self, collect_stats: bool = True):
+        self._collect_stats = collect_stats
+        self._local = threading.local()
+        self._counters: Dict[int, List[Any]] = {}
+        self._retired: List[Any] = [0, 0, 0, 0.0]
+        self._counters_lock = threading.Lock()
+        self._keys = itertools.count()
+
+    @property
+    def collect_stats(self) -> bool:
+        return self._collect_stats
 
     @abstractmethod
-    def convert(self, data: Any) -> Any:
+    def _convert(self, data: Any) -> Any:
         """
         Converts data from one format to another.
 
@@ -15,4 +86,87 @@ class BaseConverter(ABC):
         Returns:
             The converted data in the target format.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def convert(self, data: Any) -> Any:
+        """Converts a single input, recording usage statistics if enabled."""
+        if not self._collect_stats:
+            return self._convert(data)
+
+        start = time.perf_counter()
+        result = self._convert(data)
+        elapsed = time.perf_counter() - start
+
+        counter = self._thread_counter()
+        counter[0] += 1
+        counter[1] += payload_size(data)
+        counter[2] += payload_size(result)
+        counter[3] += elapsed
+        return result
+
+    def cache_identity(self) -> str:
+        """
+        A stable name for this converter and every option that affects its
+        output, such as `module.Class(option=value,...)`. Persistent caches use
+        it so differently configured instances never share entries.
+        """
+        cls = type(self)
+        name = f"{cls.__module__}.{cls.__qualname__}"
+        options = self._identity_options()
+        if not options:
+            return name
+        return name + "(" + ",".join(f"{key}={_option_identity(value)}" for key, value in sorted(options.items())) + ")"
+
+    def _identity_options(self) -> Dict[str, Any]:
+        """Options that affect output; subclasses with configuration override this."""
+        return {}
+
+    def convert_many(self, items: Iterable[Any]) -> List[Any]:
+        """Converts every input in `items` and returns the results as a list."""
+        return [self.convert(item) for item in items]
+
+    def iter_convert(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Lazily converts inputs from `items`, yielding each result as it is produced."""
+        for item in items:
+            yield self.convert(item)
+
+    def stats(self) -> ConverterStats:
+        """Returns the usage counters summed across every thread that used this instance."""
+        with self._counters_lock:
+            counters = [list(self._retired)] + list(self._counters.values())
+        calls = bytes_in = bytes_out = 0
+        seconds = 0.0
+        for counter in counters:
+            calls += counter[0]
+            bytes_in += counter[1]
+            bytes_out += counter[2]
+            seconds += counter[3]
+        return ConverterStats(calls, bytes_in, bytes_out, seconds)
+
+    def reset_stats(self) -> None:
+        """Zeroes the usage counters of every thread."""
+        with self._counters_lock:
+            for counter in [self._retired] + list(self._counters.values()):
+                counter[:] = [0, 0, 0, 0.0]
+
+    def _thread_counter(self) -> List[Any]:
+        """Returns the calling thread's counter, registering it on first use."""
+        counter = getattr(self._local, "counter", None)
+        if counter is None:
+            counter = [0, 0, 0, 0.0]
+            token = _ThreadToken()
+            key = next(self._keys)
+            with self._counters_lock:
+                self._counters[key] = counter
+            self._local.counter = counter
+            self._local.token = token
+            weakref.finalize(token, _retire_counter, weakref.ref(self), key)
+        return counter
+
+    def _retire_counter(self, key: int) -> None:
+        """Folds an exited thread's counter into the shared total."""
+        with self._counters_lock:
+            counter = self._counters.pop(key, None)
+            if counter is not None:
+                for i, value in enumerate(counter):
+                    self._retired[i] += value
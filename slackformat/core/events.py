@@ -0,0 +1,104 @@
+"""
+Event-stream (SAX-style) representation of Slack content.
+
+Parsers in `slackformat.parsers` can emit a flat stream of Events instead of
+building a whole tree, and the renderers in
+`slackformat.formatters.event_formatter` consume such streams, so any source
+can be piped to any target with memory bounded by the largest single block.
+Filters are plain generator functions from events to events.
+"""
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Union
+
+# Container events
+START_SECTION = "start_section"
+END_SECTION = "end_section"
+START_LIST = "start_list"
+END_LIST = "end_list"
+START_QUOTE = "start_quote"
+END_QUOTE = "end_quote"
+START_PREFORMATTED = "start_preformatted"
+END_PREFORMATTED = "end_preformatted"
+START_HEADER = "start_header"
+END_HEADER = "end_header"
+START_CONTEXT = "start_context"
+END_CONTEXT = "end_context"
+
+# Standalone block events
+DIVIDER = "divider"
+IMAGE = "image"
+
+# Inline events, named after the rich text element type they carry
+TEXT = "text"
+LINK = "link"
+EMOJI = "emoji"
+USER = "user"
+CHANNEL = "channel"
+USERGROUP = "usergroup"
+BROADCAST = "broadcast"
+DATE = "date"
+
+START_EVENTS = {
+    START_SECTION: END_SECTION,
+    START_LIST: END_LIST,
+    START_QUOTE: END_QUOTE,
+    START_PREFORMATTED: END_PREFORMATTED,
+    START_HEADER: END_HEADER,
+    START_CONTEXT: END_CONTEXT,
+}
+END_EVENTS = set(START_EVENTS.values())
+BLOCK_EVENTS = {DIVIDER, IMAGE}
+
+# Rich text container types and the events that bracket them
+CONTAINER_TYPES = {
+    "rich_text_section": START_SECTION,
+    "rich_text_list": START_LIST,
+    "rich_text_quote": START_QUOTE,
+    "rich_text_preformatted": START_PREFORMATTED,
+}
+
+class Event(NamedTuple):
+    """
+    A single parse event.
+
+    Attributes:
+        kind: One of the event constants in this module.
+        text: The text run for TEXT and LINK events.
+        style: The run's style dict (e.g. {"bold": True}), if any.
+        attrs: Remaining fields, such as a link's url, a list's style or a user's user_id.
+    """
+    kind: str
+    text: str = ""
+    style: Optional[Dict[str, bool]] = None
+    attrs: Optional[Dict[str, Any]] = None
+
+def element_to_event(element: Dict[str, Any]) -> Event:
+    """Converts an inline rich text element to an Event."""
+    attrs = {key: value for key, value in element.items() if key not in ("type", "text", "style")}
+    return Event(element.get("type", TEXT), element.get("text", ""), element.get("style") or None, attrs or None)
+
+def event_to_element(event: Event) -> Dict[str, Any]:
+    """Converts an inline Event back to a rich text element."""
+    element: Dict[str, Any] = {"type": event.kind}
+    if event.attrs:
+        element.update(event.attrs)
+    if event.text or event.kind == TEXT:
+        element["text"] = event.text
+    if event.style:
+        element["style"] = event.style
+    return element
+
+EventMapper = Callable[[Event], Union[Event, Iterable[Event], None]]
+
+def map_events(events: Iterable[Event], mapper: EventMapper) -> Iterator[Event]:
+    """
+    Applies `mapper` to every event. The mapper may return a replacement
+    event, an iterable of events, or None to drop the event.
+    """
+    for event in events:
+        result = mapper(event)
+        if result is None:
+            continue
+        if isinstance(result, Event):
+            yield result
+        else:
+            yield from result
\ No newline at end of file
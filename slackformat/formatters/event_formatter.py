@@ -0,0 +1,156 @@
+from typing import Dict, Any, Iterable, Iterator, List
+from ..core.events import (
+    Event, START_EVENTS, END_EVENTS, START_SECTION, START_LIST, START_QUOTE,
+    START_PREFORMATTED, START_HEADER, START_CONTEXT, DIVIDER, IMAGE, event_to_element,
+)
+from ..core.exceptions import ParsingError
+from ..parsers.richtext_parser import parse_rich_text_to_mrkdwn
+from ..utils.escape_utils import escape_mrkdwn
+from .text_formatter import format_rich_text_element_to_md
+from .plain_formatter import PlainTextCollector, format_rich_text_section_to_plain
+
+_CONTAINERS = {
+    START_SECTION: "rich_text_section",
+    START_LIST: "rich_text_list",
+    START_QUOTE: "rich_text_quote",
+    START_PREFORMATTED: "rich_text_preformatted",
+    START_HEADER: "header",
+    START_CONTEXT: "context",
+}
+
+def iter_event_blocks(events: Iterable[Event]) -> Iterator[Dict[str, Any]]:
+    """
+    Groups an event stream into its top-level blocks, yielding each one as soon
+    as it is closed. Rich text containers become rich text elements; headers,
+    contexts, dividers and images become dicts of those types. Only one
+    top-level block is held in memory at a time.
+    """
+    stack: List[Dict[str, Any]] = []
+    closers: List[str] = []
+    for event in events:
+        kind = event.kind
+        if kind in START_EVENTS:
+            container: Dict[str, Any] = {"type": _CONTAINERS[kind]}
+            if event.attrs:
+                container.update(event.attrs)
+            container["elements"] = []
+            stack.append(container)
+            closers.append(START_EVENTS[kind])
+        elif kind in END_EVENTS:
+            if not closers or closers[-1] != kind:
+                raise ParsingError(f"Unexpected {kind} event")
+            closers.pop()
+            container = stack.pop()
+            if stack:
+                stack[-1]["elements"].append(container)
+            else:
+                yield container
+        elif kind in (DIVIDER, IMAGE):
+            if stack:
+                raise ParsingError(f"{kind} event inside a {stack[-1]['type']}")
+            block = {"type": kind}
+            if event.attrs:
+                block.update(event.attrs)
+            yield block
+        elif stack:
+            stack[-1]["elements"].append(event_to_element(event))
+        else:
+            # A bare inline event forms its own section
+            yield {"type": "rich_text_section", "elements": [event_to_element(event)]}
+    if stack:
+        raise ParsingError(f"Event stream ended inside a {stack[-1]['type']}")
+
+def _join_chunks(chunks: Iterable[str], separator: str) -> Iterator[str]:
+    first = True
+    for chunk in chunks:
+        if not chunk:
+            continue
+        yield chunk if first else separator + chunk
+        first = False
+
+def _context_section(block: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "rich_text_section", "elements": block["elements"]}
+
+def _block_to_md(block: Dict[str, Any]) -> str:
+    block_type = block["type"]
+    if block_type == "header":
+        return f"## {format_rich_text_section_to_plain(block)}"
+    if block_type == "context":
+        return f"_{format_rich_text_element_to_md(_context_section(block))}_"
+    if block_type == "divider":
+        return "---"
+    if block_type == "image":
+        url, alt, title = block.get("image_url", ""), block.get("alt_text", "image"), block.get("title")
+        if url:
+            title_part = f" \"{title}\"" if title else ""
+            return f"![{alt}]({url}{title_part})"
+        return f"*[{alt}]*"
+    return format_rich_text_element_to_md(block)
+
+def _block_to_mrkdwn(block: Dict[str, Any]) -> str:
+    block_type = block["type"]
+    if block_type == "header":
+        return f"*{escape_mrkdwn(format_rich_text_section_to_plain(block))}*"
+    if block_type == "context":
+        return f"_{parse_rich_text_to_mrkdwn(_context_section(block))}_"
+    if block_type == "divider":
+        return "---"
+    if block_type == "image":
+        url, alt = escape_mrkdwn(block.get("image_url", "")), escape_mrkdwn(block.get("alt_text", "image"))
+        return f"<{url}|{alt}>" if url else alt
+    return parse_rich_text_to_mrkdwn(block)
+
+def _block_to_plain(block: Dict[str, Any]) -> str:
+    block_type = block["type"]
+    if block_type in ("header", "context"):
+        return format_rich_text_section_to_plain(block)
+    if block_type == "divider":
+        return ""
+    if block_type == "image":
+        return block.get("title") or block.get("alt_text", "")
+    collector = PlainTextCollector()
+    collector.add_rich_text(block)
+    return collector.text()
+
+def render_events_to_md(events: Iterable[Event]) -> Iterator[str]:
+    """Renders an event stream to Markdown, yielding one chunk per top-level block."""
+    return _join_chunks((_block_to_md(block) for block in iter_event_blocks(events)), "\n\n")
+
+def render_events_to_mrkdwn(events: Iterable[Event]) -> Iterator[str]:
+    """Renders an event stream to Slack mrkdwn, yielding one chunk per top-level block."""
+    return _join_chunks((_block_to_mrkdwn(block) for block in iter_event_blocks(events)), "\n")
+
+def render_events_to_plain(events: Iterable[Event]) -> Iterator[str]:
+    """Renders an event stream to unstyled text, yielding one chunk per top-level block."""
+    return _join_chunks((_block_to_plain(block) for block in iter_event_blocks(events)), "\n")
+
+def iter_events_to_rich_text(events: Iterable[Event]) -> Iterator[Dict[str, Any]]:
+    """Yields the top-level rich text elements described by an event stream."""
+    for block in iter_event_blocks(events):
+        block_type = block["type"]
+        if block_type == "header":
+            yield {"type": "rich_text_section",
+                   "elements": [{"type": "text", "text": format_rich_text_section_to_plain(block), "style": {"bold": True}}]}
+        elif block_type == "context":
+            yield _context_section(block)
+        elif block_type == "image":
+            yield {"type": "rich_text_section", "elements": [{"type": "text", "text": _block_to_plain(block)}]}
+        elif block_type != "divider":
+            yield block
+
+def build_rich_text_from_events(events: Iterable[Event]) -> Dict[str, Any]:
+    """Builds a complete rich_text object from an event stream."""
+    return {"type": "rich_text", "elements": list(iter_events_to_rich_text(events))}
+
+def iter_events_to_blockkit(events: Iterable[Event]) -> Iterator[Dict[str, Any]]:
+    """Yields one Block Kit block per top-level block of an event stream."""
+    for block in iter_event_blocks(events):
+        block_type = block["type"]
+        if block_type == "header":
+            yield {"type": "header", "text": {"type": "plain_text", "text": format_rich_text_section_to_plain(block)}}
+        elif block_type == "context":
+            yield {"type": "context", "elements": [{"type": "mrkdwn", "text": parse_rich_text_to_mrkdwn(_context_section(block))}]}
+        elif block_type in ("divider", "image"):
+            yield block
+        else:
+            yield {"type": "section", "text": {"type": "mrkdwn", "text": parse_rich_text_to_mrkdwn(block)}}
\ No newline at end of file
@@ -1,13 +1,16 @@
 from typing import Dict, Any
+from ..utils.escape_utils import escape_mrkdwn
 
 def format_link_element_to_mrkdwn(element: Dict[str, Any]) -> str:
     """Formats a link element to Slack mrkdwn."""
     url = element.get("url", "")
     text = element.get("text", url)
-    return f"<{url}|{text}>" if text != url else f"<{url}>"
+    if text != url:
+        return f"<{escape_mrkdwn(url)}|{escape_mrkdwn(text)}>"
+    return f"<{escape_mrkdwn(url)}>"
 
 def format_link_element_to_md(element: Dict[str, Any]) -> str:
-    """Formats a link element to standard Markdown."""
+    """Formats a link element to standard Markdown, encoding entities as text runs do."""
     url = element.get("url", "")
     text = element.get("text", url)
-    return f"[{text}]({url})"
\ No newline at end of file
+    return f"[{escape_mrkdwn(text)}]({escape_mrkdwn(url)})"
\ No newline at end of file
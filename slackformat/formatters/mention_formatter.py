@@ -0,0 +1,28 @@
+from typing import Dict, Any, Optional
+from ..utils.escape_utils import escape_mrkdwn
+
+def format_mention_element(element: Dict[str, Any]) -> Optional[str]:
+    """
+    Formats emoji, mention and date elements to Slack's token syntax.
+
+    Returns None if the element is not one of these types.
+    """
+    elem_type = element.get("type", "")
+    if elem_type == "emoji":
+        return f":{element.get('name', '')}:"
+    if elem_type == "user":
+        return _token(f"<@{element.get('user_id', '')}", element)
+    if elem_type == "channel":
+        return _token(f"<#{element.get('channel_id', '')}", element)
+    if elem_type == "usergroup":
+        return _token(f"<!subteam^{element.get('usergroup_id', '')}", element)
+    if elem_type == "broadcast":
+        return f"<!{element.get('range', 'here')}>"
+    if elem_type == "date":
+        return _token(f"<!date^{element.get('timestamp', '')}^{element.get('format', '')}", element)
+    return None
+
+def _token(token: str, element: Dict[str, Any]) -> str:
+    """Closes a `<...` token, keeping the element's fallback as its `|label`."""
+    fallback = element.get("fallback")
+    return f"{token}|{escape_mrkdwn(fallback)}>" if fallback else f"{token}>"
\ No newline at end of file
@@ -0,0 +1,102 @@
+import re
+from typing import Dict, Any, List
+
+def format_inline_element_to_plain(element: Dict[str, Any]) -> str:
+    """Formats a single inline rich text element to unstyled text."""
+    elem_type = element.get("type", "")
+    if elem_type == "text":
+        return element.get("text", "")
+    if elem_type == "link":
+        return element.get("text") or element.get("url", "")
+    if elem_type == "emoji":
+        return f":{element.get('name', '')}:"
+    if elem_type == "user":
+        return _mention("@", element.get("fallback") or element.get("user_id", ""))
+    if elem_type == "channel":
+        return _mention("#", element.get("fallback") or element.get("channel_id", ""))
+    if elem_type == "usergroup":
+        return _mention("@", element.get("fallback") or element.get("usergroup_id", ""))
+    if elem_type == "broadcast":
+        return f"@{element.get('range', 'here')}"
+    if elem_type == "date":
+        return element.get("fallback") or str(element.get("timestamp", ""))
+    if elem_type == "rich_text_section":
+        return format_rich_text_section_to_plain(element)
+    return element.get("text", "")
+
+def _mention(sigil: str, name: str) -> str:
+    # Labels such as `<!subteam^S1|@eng>` may already carry the sigil
+    return name if name.startswith(sigil) else sigil + name
+
+def format_rich_text_section_to_plain(section: Dict[str, Any]) -> str:
+    """Converts a rich_text_section (or quote/preformatted) to unstyled text."""
+    return "".join([format_inline_element_to_plain(elem) for elem in section.get("elements", [])])
+
+_EMOJI_SHORTCODE = re.compile(r"(?<![\w:]):([a-z0-9_+'-]*[a-z_][a-z0-9_+'-]*):(?!\w)")
+_ENTITY_TYPES = {"user": "user_id", "channel": "channel_id", "usergroup": "usergroup_id", "emoji": "name", "link": "url"}
+
+class PlainTextCollector:
+    """
+    Accumulates unstyled text, and optionally entity IDs, while walking rich text
+    elements, so text and entities come out of the same traversal.
+    """
+
+    def __init__(self, collect_entities: bool = False):
+        self.collect_entities = collect_entities
+        self.lines: List[str] = []
+        self.entities: Dict[str, Dict[str, None]] = {key: {} for key in _ENTITY_TYPES}
+
+    def add_text(self, text: str) -> None:
+        """Adds a line of already-unstyled text."""
+        if text:
+            self.lines.append(text)
+
+    def add_elements(self, elements: List[Dict[str, Any]]) -> None:
+        """Adds a line rendered from a list of inline rich text elements."""
+        parts = []
+        for element in elements:
+            parts.append(format_inline_element_to_plain(element))
+            if self.collect_entities:
+                self._record(element)
+        line = "".join(parts)
+        if self.collect_entities:
+            self._record_emoji_shortcodes(elements, line)
+        self.add_text(line)
+
+    def add_rich_text(self, element: Dict[str, Any]) -> None:
+        """Adds any rich text object: rich_text, section, list, quote or preformatted."""
+        elem_type = element.get("type")
+        if elem_type == "rich_text":
+            for child in element.get("elements", []):
+                self.add_rich_text(child)
+        elif elem_type == "rich_text_list":
+            for item in element.get("elements", []):
+                self.add_elements(item.get("elements", []))
+        elif elem_type in ("rich_text_section", "rich_text_quote", "rich_text_preformatted"):
+            self.add_elements(element.get("elements", []))
+
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    def _record(self, element: Dict[str, Any]) -> None:
+        elem_type = element.get("type", "")
+        if elem_type == "rich_text_section":
+            for child in element.get("elements", []):
+                self._record(child)
+            return
+        key = _ENTITY_TYPES.get(elem_type)
+        if key and element.get(key):
+            self.entities[elem_type][element[key]] = None
+
+    def _record_emoji_shortcodes(self, elements: List[Dict[str, Any]], line: str) -> None:
+        # Emoji typed as :shortcode: in mrkdwn arrive as text, possibly split
+        # across runs by the parser, so scan the joined line minus code spans.
+        if ":" not in line:
+            return
+        if any(elem.get("style", {}).get("code") for elem in elements):
+            line = "".join([
+                " " if elem.get("style", {}).get("code") else format_inline_element_to_plain(elem)
+                for elem in elements
+            ])
+        for name in _EMOJI_SHORTCODE.findall(line):
+            self.entities["emoji"][name] = None
\ No newline at end of file
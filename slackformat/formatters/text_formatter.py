@@ -1,15 +1,20 @@
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional
+from ..utils.escape_utils import escape_mrkdwn
 from ..utils.style_utils import apply_mrkdwn_style, apply_md_style
+from .mention_formatter import format_mention_element
 
 def format_text_element_to_mrkdwn(element: Dict[str, Any]) -> str:
     """Formats a text element to Slack's mrkdwn."""
-    text = element.get("text", "")
+    text = escape_mrkdwn(element.get("text", ""))
     style = element.get("style", {})
     return apply_mrkdwn_style(text, style)
 
 def format_text_element_to_md(element: Dict[str, Any]) -> str:
-    """Formats a text element to standard Markdown."""
-    text = element.get("text", "")
+    """
+    Formats a text element to standard Markdown. `&`, `<` and `>` are encoded
+    as entities, which both CommonMark and the mrkdwn parser decode again.
+    """
+    text = escape_mrkdwn(element.get("text", ""))
     style = element.get("style", {})
     return apply_md_style(text, style)
 
@@ -24,9 +29,50 @@ def format_rich_text_section_to_md(section: Dict[str, Any]) -> str:
             parts.append(format_text_element_to_md(element))
         elif elem_type == "link":
             parts.append(format_link_element_to_md(element))
-        elif elem_type == "emoji":
-            parts.append(f":{element.get('name', '')}:")
-        elif elem_type == "user":
-            parts.append(f"<@{element.get('user_id', '')}>")
-        # Add other types as needed
-    return "".join(parts)
\ No newline at end of file
+        elif elem_type == "rich_text_section":
+            parts.append(format_rich_text_section_to_md(element))
+        else:
+            mention = format_mention_element(element)
+            if mention is not None:
+                parts.append(mention)
+    return "".join(parts)
+
+def format_preformatted_to_text(preformatted: Dict[str, Any], escape: Optional[Callable[[str], str]] = None) -> str:
+    """
+    Renders the elements of a rich_text_preformatted block verbatim, without
+    styling. `escape`, if given, is applied to text and link runs but not to
+    mention tokens.
+    """
+    escape = escape or (lambda text: text)
+    parts = []
+    for element in preformatted.get("elements", []):
+        elem_type = element.get("type", "")
+        if elem_type == "text":
+            parts.append(escape(element.get("text", "")))
+        elif elem_type == "link":
+            parts.append(escape(element.get("text") or element.get("url", "")))
+        else:
+            mention = format_mention_element(element)
+            if mention is not None:
+                parts.append(mention)
+    return "".join(parts)
+
+def format_rich_text_element_to_md(element: Dict[str, Any]) -> str:
+    """Converts any rich text block child (section, list, quote, preformatted) to Markdown."""
+    from .list_formatter import format_list_element_to_md # avoid circular import
+
+    elem_type = element.get("type")
+    if elem_type == "rich_text_section":
+        return format_rich_text_section_to_md(element)
+    if elem_type == "rich_text_list":
+        return format_list_element_to_md(element)
+    if elem_type == "rich_text_quote":
+        text = format_rich_text_section_to_md(element)
+        return "\n".join([f"> {line}" for line in text.split('\n')])
+    if elem_type == "rich_text_preformatted":
+        return f"```\n{format_preformatted_to_text(element)}\n```"
+    return ""
+
+def format_rich_text_elements_to_md(elements: List[Dict[str, Any]]) -> str:
+    """Converts the children of a rich_text block to Markdown in a single pass."""
+    return "\n\n".join(filter(None, [format_rich_text_element_to_md(elem) for elem in elements]))
\ No newline at end of file
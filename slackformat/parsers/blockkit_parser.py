@@ -1,4 +1,10 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, Union
+from ..core.events import (
+    element_to_event, Event, START_SECTION, END_SECTION, START_HEADER, END_HEADER,
+    START_CONTEXT, END_CONTEXT, DIVIDER, IMAGE, TEXT,
+)
+from .markdown_parser import iter_markdown_events, parse_markdown_to_elements
+from .richtext_parser import iter_rich_text_events
 
 def extract_text_from_block(block: Any) -> str:
     """Recursively extract any text content from a block object."""
@@ -28,4 +34,71 @@ def extract_text_from_block(block: Any) -> str:
         # Join text from all items in the list
         return " ".join(filter(None, [extract_text_from_block(item) for item in block]))
     
-    return ""
\ No newline at end of file
+    return ""
+
+def iter_blockkit_events(blocks: Union[Dict[str, Any], Iterable[Dict[str, Any]]]) -> Iterator[Event]:
+    """
+    Yields a Block Kit block, or a sequence of blocks, as a stream of events.
+
+    mrkdwn section text is parsed into sections and lists, and mrkdwn context
+    elements into inline events, so filters such as mention replacement can see
+    their elements. Rendering the stream to Markdown therefore matches
+    blockkit_to_richtext followed by richtext_to_markdown for that text
+    (standard `**bold**`, `-` bullets, a blank line between lines; contexts
+    wrapped in `_`), whereas blockkit_to_markdown passes mrkdwn through
+    verbatim. Every other block type renders as blockkit_to_markdown does.
+    """
+    if isinstance(blocks, dict):
+        blocks = [blocks]
+    for block in blocks:
+        if not block:
+            continue
+        block_type = block.get("type", "")
+
+        if block_type == "section":
+            text_obj = block.get("text") or {}
+            if text_obj.get("type") == "mrkdwn":
+                yield from iter_markdown_events(text_obj.get("text", ""))
+            else:
+                yield Event(START_SECTION)
+                yield Event(TEXT, text_obj.get("text", ""))
+                yield Event(END_SECTION)
+        elif block_type == "header":
+            yield Event(START_HEADER)
+            yield Event(TEXT, extract_text_from_block(block.get("text")))
+            yield Event(END_HEADER)
+        elif block_type == "divider":
+            yield Event(DIVIDER)
+        elif block_type == "context":
+            yield Event(START_CONTEXT)
+            yield from _iter_context_events(block.get("elements") or [])
+            yield Event(END_CONTEXT)
+        elif block_type == "image":
+            yield Event(IMAGE, attrs={
+                "image_url": block.get("image_url", ""),
+                "alt_text": block.get("alt_text", "image"),
+                "title": extract_text_from_block(block.get("title")),
+            })
+        elif block_type == "rich_text":
+            yield from iter_rich_text_events(block)
+        else:
+            yield Event(START_SECTION)
+            yield Event(TEXT, extract_text_from_block(block))
+            yield Event(END_SECTION)
+
+def _iter_context_events(elements: Iterable[Dict[str, Any]]) -> Iterator[Event]:
+    """Yields a context's elements as inline events, one space between elements."""
+    first = True
+    for element in elements:
+        if element.get("type") == "mrkdwn":
+            lines = [line.strip() for line in element.get("text", "").split("\n")]
+            runs = [parse_markdown_to_elements(line) for line in lines if line]
+        else:
+            text = extract_text_from_block(element)
+            runs = [[{"type": "text", "text": text}]] if text else []
+        for run in runs:
+            if not first:
+                yield Event(TEXT, " ")
+            first = False
+            for inline in run:
+                yield element_to_event(inline)
\ No newline at end of file
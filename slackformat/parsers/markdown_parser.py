@@ -1,11 +1,18 @@
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Union
+from ..core.events import Event, START_SECTION, END_SECTION, START_LIST, END_LIST, element_to_event
+from ..utils.escape_utils import unescape_entities
+
+LIST_ITEM_PATTERN = re.compile(r'^([•*-]|\d+\.)\s+')
+ORDERED_ITEM_PATTERN = re.compile(r'^\d+\.\s+')
 
 def parse_markdown_to_elements(text: str) -> List[Dict[str, Any]]:
     """Parse inline markdown formatting into a list of rich text elements."""
     elements = []
     i = 0
-    
+    # Entities are decoded per run, after tokenizing, so `&lt;` can never open a link
+    decode = unescape_entities if '&' in text else str
+
     while i < len(text):
         char = text[i]
         
@@ -13,40 +20,35 @@ def parse_markdown_to_elements(text: str) -> List[Dict[str, Any]]:
         if char == '*':
             end = _find_closing_delimiter(text, i, '*')
             if end != -1 and end > i + 1:
-                elements.append({"type": "text", "text": text[i+1:end], "style": {"bold": True}})
+                elements.append({"type": "text", "text": decode(text[i+1:end]), "style": {"bold": True}})
                 i = end + 1
                 continue
         # Italic
         elif char == '_':
             end = _find_closing_delimiter(text, i, '_')
             if end != -1 and end > i + 1:
-                elements.append({"type": "text", "text": text[i+1:end], "style": {"italic": True}})
+                elements.append({"type": "text", "text": decode(text[i+1:end]), "style": {"italic": True}})
                 i = end + 1
                 continue
         # Strike
         elif char == '~':
             end = _find_closing_delimiter(text, i, '~')
             if end != -1 and end > i + 1:
-                elements.append({"type": "text", "text": text[i+1:end], "style": {"strike": True}})
+                elements.append({"type": "text", "text": decode(text[i+1:end]), "style": {"strike": True}})
                 i = end + 1
                 continue
         # Code
         elif char == '`':
             end = _find_closing_delimiter(text, i, '`')
             if end != -1 and end > i + 1:
-                elements.append({"type": "text", "text": text[i+1:end], "style": {"code": True}})
+                elements.append({"type": "text", "text": decode(text[i+1:end]), "style": {"code": True}})
                 i = end + 1
                 continue
         # Link
         elif char == '<':
             end = text.find('>', i)
             if end != -1 and end > i + 1:
-                content = text[i+1:end]
-                if '|' in content:
-                    url, display_text = content.split('|', 1)
-                    elements.append({"type": "link", "url": url.strip(), "text": display_text.strip()})
-                else:
-                    elements.append({"type": "link", "url": content.strip(), "text": content.strip()})
+                elements.append(_parse_angle_bracket(text[i+1:end]))
                 i = end + 1
                 continue
 
@@ -54,14 +56,75 @@ def parse_markdown_to_elements(text: str) -> List[Dict[str, Any]]:
         next_special = _find_next_special_char(text, i + 1)
         if next_special == -1:
             if i < len(text):
-                elements.append({"type": "text", "text": text[i:]})
+                elements.append({"type": "text", "text": decode(text[i:])})
             break
         else:
-            elements.append({"type": "text", "text": text[i:next_special]})
+            elements.append({"type": "text", "text": decode(text[i:next_special])})
             i = next_special
 
     return elements
 
+def iter_markdown_events(source: Union[str, Iterable[str]]) -> Iterator[Event]:
+    """
+    Parse Slack Markdown into a stream of events, one line at a time.
+
+    `source` may be a string or any iterable of lines, such as an open file, in
+    which case the document is never held in memory as a whole. The events
+    describe the same structure md_to_richtext builds.
+    """
+    lines = source.split('\n') if isinstance(source, str) else source
+    for line in lines:
+        stripped_line = line.strip()
+        if not stripped_line:
+            continue
+
+        marker = LIST_ITEM_PATTERN.match(stripped_line)
+        if marker:
+            style = "ordered" if ORDERED_ITEM_PATTERN.match(stripped_line) else "bullet"
+            yield Event(START_LIST, attrs={"style": style})
+            yield Event(START_SECTION)
+            for element in parse_markdown_to_elements(stripped_line[marker.end():]):
+                yield element_to_event(element)
+            yield Event(END_SECTION)
+            yield Event(END_LIST)
+        else:
+            yield Event(START_SECTION)
+            for element in parse_markdown_to_elements(stripped_line):
+                yield element_to_event(element)
+            yield Event(END_SECTION)
+
+def _parse_angle_bracket(content: str) -> Dict[str, Any]:
+    """Parse the contents of a <...> token into a mention, date or link element."""
+    target, _, label = content.partition('|')
+    # Decoded only after splitting, so an encoded `&gt;` in the label cannot end the token
+    target = unescape_entities(target.strip())
+    label = unescape_entities(label.strip())
+
+    if target.startswith('@') and len(target) > 1:
+        return _with_fallback({"type": "user", "user_id": target[1:]}, label)
+    if target.startswith('#') and len(target) > 1:
+        return _with_fallback({"type": "channel", "channel_id": target[1:]}, label)
+    if target.startswith('!subteam^'):
+        return _with_fallback({"type": "usergroup", "usergroup_id": target[len('!subteam^'):]}, label)
+    if target.startswith('!date^'):
+        parts = target[len('!date^'):].split('^')
+        timestamp = parts[0]
+        element = {"type": "date", "timestamp": int(timestamp) if timestamp.isdigit() else timestamp,
+                   "format": parts[1] if len(parts) > 1 else ""}
+        return _with_fallback(element, label)
+    if target in ('!here', '!channel', '!everyone'):
+        return {"type": "broadcast", "range": target[1:]}
+
+    if label:
+        return {"type": "link", "url": target, "text": label}
+    return {"type": "link", "url": target, "text": target}
+
+def _with_fallback(element: Dict[str, Any], label: str) -> Dict[str, Any]:
+    """Keeps a token's `|label` as the element's fallback display text."""
+    if label:
+        element["fallback"] = label
+    return element
+
 def _find_closing_delimiter(text: str, start: int, delimiter: str) -> int:
     """Find the closing delimiter, ignoring escaped ones."""
     i = start + 1
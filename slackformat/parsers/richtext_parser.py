@@ -1,7 +1,10 @@
-from typing import Dict, List, Any
-from ..formatters.text_formatter import format_text_element_to_mrkdwn
+from typing import Dict, List, Any, Iterator
+from ..formatters.text_formatter import format_text_element_to_mrkdwn, format_preformatted_to_text
 from ..formatters.link_formatter import format_link_element_to_mrkdwn
 from ..formatters.list_formatter import format_list_element_to_mrkdwn
+from ..formatters.mention_formatter import format_mention_element
+from ..utils.escape_utils import escape_mrkdwn
+from ..core.events import Event, CONTAINER_TYPES, START_EVENTS, element_to_event
 
 def parse_rich_text_to_mrkdwn(richtext_obj: Dict[str, Any]) -> str:
     """Parses a rich text object and returns a markdown string."""
@@ -19,6 +22,13 @@ def parse_rich_text_to_mrkdwn(richtext_obj: Dict[str, Any]) -> str:
         
     if obj_type == "rich_text_list":
         return format_list_element_to_mrkdwn(richtext_obj, _parse_rich_text_section)
+
+    if obj_type == "rich_text_quote":
+        text = _parse_rich_text_section(richtext_obj)
+        return "\n".join([f"> {line}" for line in text.split('\n')])
+
+    if obj_type == "rich_text_preformatted":
+        return f"```\n{format_preformatted_to_text(richtext_obj, escape_mrkdwn)}\n```"
         
     return ""
 
@@ -32,13 +42,36 @@ def _parse_rich_text_section(section: Dict[str, Any]) -> str:
             parts.append(format_text_element_to_mrkdwn(element))
         elif elem_type == "link":
             parts.append(format_link_element_to_mrkdwn(element))
-        elif elem_type == "emoji":
-            parts.append(f":{element.get('name', '')}:")
-        elif elem_type == "user":
-            parts.append(f"<@{element.get('user_id', '')}>")
-        elif elem_type == "channel":
-            parts.append(f"<#{element.get('channel_id', '')}>")
+        elif elem_type == "rich_text_section":
+            parts.append(_parse_rich_text_section(element))
         else:
-            parts.append(element.get("text", str(element)))
+            mention = format_mention_element(element)
+            parts.append(mention if mention is not None else element.get("text", str(element)))
             
-    return "".join(parts)
\ No newline at end of file
+    return "".join(parts)
+
+def iter_rich_text_events(richtext_obj: Dict[str, Any]) -> Iterator[Event]:
+    """Walks a rich text object and yields it as a stream of events."""
+    if not richtext_obj or not isinstance(richtext_obj, dict):
+        return
+
+    obj_type = richtext_obj.get("type")
+    if obj_type == "rich_text":
+        for element in richtext_obj.get("elements", []):
+            yield from iter_rich_text_events(element)
+        return
+
+    start = CONTAINER_TYPES.get(obj_type)
+    if start is None:
+        yield element_to_event(richtext_obj)
+        return
+
+    attrs = None
+    if obj_type == "rich_text_list":
+        attrs = {"style": richtext_obj.get("style", "bullet")}
+        if richtext_obj.get("indent"):
+            attrs["indent"] = richtext_obj["indent"]
+    yield Event(start, attrs=attrs)
+    for element in richtext_obj.get("elements", []):
+        yield from iter_rich_text_events(element)
+    yield Event(START_EVENTS[start])
\ No newline at end of file
@@ -0,0 +1 @@
+# resolvers/__init__.py
\ No newline at end of file
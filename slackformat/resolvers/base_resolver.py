@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Mapping, Set
+
+# Mention kinds a resolver is asked about, matching the rich text element types
+MENTION_KINDS = ("user", "channel", "usergroup")
+
+MentionIds = Mapping[str, Set[str]]
+MentionNames = Dict[str, Dict[str, str]]
+
+class BaseResolver(ABC):
+    """Abstract base class for directory lookups of mention display names."""
+
+    @abstractmethod
+    def resolve(self, ids: MentionIds) -> MentionNames:
+        """
+        Resolves IDs to display names in one bulk call.
+
+        Args:
+            ids: A mapping of mention kind ("user", "channel", "usergroup") to the IDs to look up.
+
+        Returns:
+            A mapping of mention kind to {id: display name}. IDs that cannot be
+            resolved may simply be left out.
+        """
+        pass
+
+class AsyncBaseResolver(ABC):
+    """Abstract base class for asynchronous directory lookups of mention display names."""
+
+    @abstractmethod
+    async def resolve(self, ids: MentionIds) -> MentionNames:
+        """Asynchronous counterpart of BaseResolver.resolve."""
+        pass
\ No newline at end of file
@@ -0,0 +1,37 @@
+from typing import Dict, Optional
+from .base_resolver import BaseResolver, AsyncBaseResolver, MentionIds, MentionNames
+
+class DictResolver(BaseResolver):
+    """An in-memory resolver backed by dicts, for tests and benchmarks. Counts its round-trips."""
+
+    def __init__(
+        self,
+        users: Optional[Dict[str, str]] = None,
+        channels: Optional[Dict[str, str]] = None,
+        usergroups: Optional[Dict[str, str]] = None,
+    ):
+        self.directory = {"user": users or {}, "channel": channels or {}, "usergroup": usergroups or {}}
+        self.calls = 0
+        self.ids_requested = 0
+
+    def resolve(self, ids: MentionIds) -> MentionNames:
+        self.calls += 1
+        names: MentionNames = {}
+        for kind, kind_ids in ids.items():
+            self.ids_requested += len(kind_ids)
+            known = self.directory.get(kind, {})
+            names[kind] = {id_: known[id_] for id_ in kind_ids if id_ in known}
+        return names
+
+class AsyncDictResolver(AsyncBaseResolver):
+    """Asynchronous variant of DictResolver."""
+
+    def __init__(self, *args, **kwargs):
+        self._resolver = DictResolver(*args, **kwargs)
+
+    @property
+    def calls(self) -> int:
+        return self._resolver.calls
+
+    async def resolve(self, ids: MentionIds) -> MentionNames:
+        return self._resolver.resolve(ids)
\ No newline at end of file
@@ -0,0 +1,113 @@
+import inspect
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from ..core.events import Event
+from ..parsers.markdown_parser import iter_markdown_events
+from ..parsers.richtext_parser import iter_rich_text_events
+from ..parsers.blockkit_parser import iter_blockkit_events
+from ..formatters.event_formatter import render_events_to_md, render_events_to_mrkdwn, render_events_to_plain
+from ..utils.event_filters import replace_mentions
+from .base_resolver import AsyncBaseResolver, BaseResolver, MENTION_KINDS, MentionNames
+from .ttl_cache import TTLCache
+
+_ID_KEYS = {"user": "user_id", "channel": "channel_id", "usergroup": "usergroup_id"}
+
+SOURCES: Dict[str, Callable[[Any], Iterable[Event]]] = {
+    "richtext": iter_rich_text_events,
+    "blockkit": iter_blockkit_events,
+    "markdown": iter_markdown_events,
+}
+TARGETS: Dict[str, Callable[[Iterable[Event]], Iterable[str]]] = {
+    "markdown": render_events_to_md,
+    "mrkdwn": render_events_to_mrkdwn,
+    "plain": render_events_to_plain,
+}
+
+class MentionRenderer:
+    """
+    Renders documents with user, channel and usergroup mentions replaced by
+    display names.
+
+    For each batch, every mention ID is collected first. Only IDs not in the
+    TTL/LRU cache go to the resolver, in one bulk call, and then each document is
+    rendered with the names inline. Both synchronous and asynchronous resolvers
+    are supported. Unknown IDs are cached too and keep their raw mention.
+    """
+
+    def __init__(
+        self,
+        resolver: Union[BaseResolver, AsyncBaseResolver],
+        source: str = "richtext",
+        target: str = "markdown",
+        cache: Optional[TTLCache] = None,
+    ):
+        if source not in SOURCES:
+            raise ValueError(f"Unknown source {source!r}; expected one of {sorted(SOURCES)}")
+        if target not in TARGETS:
+            raise ValueError(f"Unknown target {target!r}; expected one of {sorted(TARGETS)}")
+        self.resolver = resolver
+        self.source = source
+        self.target = target
+        self.cache = cache if cache is not None else TTLCache()
+        self.round_trips = 0
+
+    def render(self, document: Any) -> str:
+        """Renders a single document."""
+        return self.render_many([document])[0]
+
+    def render_many(self, documents: Iterable[Any]) -> List[str]:
+        """Renders a batch of documents with at most one resolver call."""
+        if inspect.iscoroutinefunction(self.resolver.resolve):
+            raise TypeError("This resolver is asynchronous; use render_many_async")
+        streams, names, missing = self._prepare(documents)
+        if missing:
+            self.round_trips += 1
+            self._store(missing, self.resolver.resolve(missing), names)
+        return self._render(streams, names)
+
+    async def render_many_async(self, documents: Iterable[Any]) -> List[str]:
+        """Renders a batch of documents with at most one (possibly awaited) resolver call."""
+        streams, names, missing = self._prepare(documents)
+        if missing:
+            self.round_trips += 1
+            resolved = self.resolver.resolve(missing)
+            if inspect.isawaitable(resolved):
+                resolved = await resolved
+            self._store(missing, resolved, names)
+        return self._render(streams, names)
+
+    def _prepare(
+        self, documents: Iterable[Any],
+    ) -> Tuple[List[List[Event]], Dict[Tuple[str, str], str], Dict[str, Set[str]]]:
+        parse = SOURCES[self.source]
+        streams = []
+        wanted: Set[Tuple[str, str]] = set()
+        for document in documents:
+            events = list(parse(document))
+            for event in events:
+                key = _ID_KEYS.get(event.kind)
+                if key and event.attrs and event.attrs.get(key):
+                    wanted.add((event.kind, event.attrs[key]))
+            streams.append(events)
+
+        cached = self.cache.get_many(wanted)
+        names = {key: name for key, name in cached.items() if name is not None}
+        missing: Dict[str, Set[str]] = {}
+        for kind, id_ in wanted:
+            if (kind, id_) not in cached:
+                missing.setdefault(kind, set()).add(id_)
+        return streams, names, missing
+
+    def _store(self, missing: Dict[str, Set[str]], resolved: MentionNames, names: Dict[Tuple[str, str], str]) -> None:
+        entries = []
+        for kind in MENTION_KINDS:
+            found = (resolved or {}).get(kind) or {}
+            for id_ in missing.get(kind, ()):
+                name = found.get(id_)
+                entries.append(((kind, id_), name))
+                if name is not None:
+                    names[(kind, id_)] = name
+        self.cache.set_many(entries)
+
+    def _render(self, streams: List[List[Event]], names: Dict[Tuple[str, str], str]) -> List[str]:
+        render = TARGETS[self.target]
+        return ["".join(render(replace_mentions(events, names))) for events in streams]
\ No newline at end of file
@@ -0,0 +1,55 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, Tuple
+
+_MISSING = object()
+
+class TTLCache:
+    """
+    A thread-safe mapping with least-recently-used eviction and a per-entry
+    time to live.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, object]:
+        """Returns the live entries among `keys`, marking them as recently used."""
+        now = self._clock()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key, _MISSING)
+                if entry is _MISSING:
+                    continue
+                expires, value = entry
+                if expires <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+        return found
+
+    def set_many(self, items: Iterable[Tuple[Hashable, object]]) -> None:
+        """Stores entries, evicting the least recently used ones beyond `maxsize`."""
+        expires = self._clock() + self.ttl
+        with self._lock:
+            for key, value in items:
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
\ No newline at end of file
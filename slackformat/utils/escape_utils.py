@@ -0,0 +1,35 @@
+"""
+Table-driven escaping for Markdown, Slack mrkdwn and Slack's HTML entities.
+
+Markdown escaping uses a `str.translate` table built once at import time.
+Slack entities touch only three characters, so encoding chains C-level
+`str.replace` calls (`&` first), which beats both a table and a regex. Decoding
+is a single precompiled regex pass with a dict lookup, so `&amp;lt;` decodes to
+`&lt;` rather than `<`.
+"""
+import re
+from typing import Dict
+
+MARKDOWN_SPECIAL_CHARS = r'\`*_{}[]()#+-.!|~'
+
+# Slack only requires these three characters to be encoded in mrkdwn
+SLACK_ENTITIES: Dict[str, str] = {"&amp;": "&", "&lt;": "<", "&gt;": ">"}
+
+_MARKDOWN_TABLE = str.maketrans({char: "\\" + char for char in MARKDOWN_SPECIAL_CHARS})
+_ENTITY_PATTERN = re.compile("|".join(SLACK_ENTITIES))
+
+def escape_markdown(text: str) -> str:
+    """Backslash-escape every Markdown special character in `text`."""
+    return text.translate(_MARKDOWN_TABLE) if text else ""
+
+def escape_mrkdwn(text: str) -> str:
+    """Encode `&`, `<` and `>` as Slack entities."""
+    if not text or ("&" not in text and "<" not in text and ">" not in text):
+        return text or ""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def unescape_entities(text: str) -> str:
+    """Decode Slack's `&amp;`, `&lt;` and `&gt;` entities in one pass."""
+    if not text or "&" not in text:
+        return text or ""
+    return _ENTITY_PATTERN.sub(lambda match: SLACK_ENTITIES[match.group()], text)
\ No newline at end of file
@@ -0,0 +1,36 @@
+import re
+from typing import Iterable, Iterator, Mapping, Pattern, Tuple, Union
+from ..core.events import Event, TEXT, LINK, USER, CHANNEL, USERGROUP
+
+_MENTION_PREFIXES = {USER: ("user_id", "@"), CHANNEL: ("channel_id", "#"), USERGROUP: ("usergroup_id", "@")}
+
+def redact(events: Iterable[Event], pattern: Union[str, Pattern[str]], replacement: str = "[redacted]") -> Iterator[Event]:
+    """Replaces every match of `pattern` in text runs, link text and link URLs."""
+    regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+    for event in events:
+        if event.kind == TEXT:
+            yield event._replace(text=regex.sub(replacement, event.text))
+        elif event.kind == LINK:
+            attrs = dict(event.attrs or {})
+            if "url" in attrs:
+                attrs["url"] = regex.sub(replacement, attrs["url"])
+            yield event._replace(text=regex.sub(replacement, event.text), attrs=attrs)
+        else:
+            yield event
+
+def replace_mentions(events: Iterable[Event], names: Mapping[Tuple[str, str], str]) -> Iterator[Event]:
+    """
+    Replaces user, channel and usergroup mentions with text runs such as
+    "@Jane" or "#general". `names` is keyed by (kind, ID), e.g.
+    `("user", "U1")`, so a user and a channel sharing an ID never swap names.
+    Unknown mentions are left untouched.
+    """
+    for event in events:
+        mention = _MENTION_PREFIXES.get(event.kind)
+        if mention and event.attrs:
+            key, prefix = mention
+            name = names.get((event.kind, event.attrs.get(key, "")))
+            if name is not None:
+                yield Event(TEXT, f"{prefix}{name}", event.style)
+                continue
+        yield event
\ No newline at end of file
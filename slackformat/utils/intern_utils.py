@@ -0,0 +1,86 @@
+import sys
+import weakref
+from typing import Any, Hashable, Optional, Tuple, Union
+
+class FrozenDict(dict):
+    """A read-only dict that can be weakly referenced and shared between trees."""
+    __slots__ = ("__weakref__",)
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("interned elements are read-only; copy with dict(element) before modifying")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenDict, (dict(self),))
+
+class FrozenList(list):
+    """A read-only list that can be weakly referenced and shared between trees."""
+    __slots__ = ("__weakref__",)
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("interned elements are read-only; copy with list(elements) before modifying")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenList, (list(self),))
+
+class Interner:
+    """
+    Hash-conses JSON-like trees so structurally identical subtrees (styles,
+    leaf elements, whole sections) are stored once.
+
+    Interned dicts and lists are returned as FrozenDict and FrozenList, which
+    compare equal to plain dicts and lists and serialize the same way. The
+    table holds its nodes weakly: an entry disappears as soon as no tree uses
+    it. Parents are keyed on the identity of their already-interned children,
+    so each lookup costs one shallow tuple regardless of subtree depth.
+    """
+
+    def __init__(self, max_string_length: int = 64):
+        self.max_string_length = max_string_length
+        self._table: "weakref.WeakValueDictionary[Hashable, Any]" = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def intern(self, obj: Any) -> Any:
+        """Return a shared, read-only equivalent of `obj`."""
+        if isinstance(obj, dict):
+            items = [(key, self.intern(value)) for key, value in obj.items()]
+            return self._lookup(("d", tuple((key, _identity(value)) for key, value in items)),
+                                lambda: FrozenDict(items))
+        if isinstance(obj, list):
+            values = [self.intern(value) for value in obj]
+            return self._lookup(("l", tuple(_identity(value) for value in values)),
+                                lambda: FrozenList(values))
+        if isinstance(obj, str) and len(obj) <= self.max_string_length:
+            return sys.intern(obj)
+        return obj
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def _lookup(self, key: Hashable, build: Any) -> Any:
+        node = self._table.get(key)
+        if node is not None:
+            self.hits += 1
+            return node
+        self.misses += 1
+        return self._table.setdefault(key, build())
+
+def _identity(value: Any) -> Hashable:
+    """Key a child by identity if it is an interned container, else by type and value."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return ("id", id(value))
+    return (type(value).__name__, value)
+
+default_interner = Interner()
+
+def resolve_interner(intern: Union[bool, Interner]) -> Optional[Interner]:
+    """Map a converter's `intern` option to an Interner: True selects the default one."""
+    if isinstance(intern, Interner):
+        return intern
+    return default_interner if intern else None
\ No newline at end of file
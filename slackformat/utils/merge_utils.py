@@ -1,19 +1,29 @@
 from typing import List, Dict, Any
 
 def merge_text_elements(elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Merge consecutive text elements that have the same style."""
+    """
+    Merge consecutive text elements that have the same style.
+
+    Elements that are not merged are returned as-is rather than copied, so the
+    result may share (possibly interned, read-only) elements with the input.
+    """
     if not elements:
         return []
     
-    merged = [elements[0].copy()]
+    merged = [elements[0]]
+    owned = False  # whether merged[-1] is a copy made by this function
     for element in elements[1:]:
         last = merged[-1]
         if (element.get("type") == "text" and 
             last.get("type") == "text" and 
             element.get("style", {}) == last.get("style", {})):
+            if not owned:
+                last = merged[-1] = dict(last)
+                owned = True
             last["text"] += element["text"]
         else:
-            merged.append(element.copy())
+            merged.append(element)
+            owned = False
             
     return merged
 
@@ -1,4 +1,5 @@
 import re
+from .escape_utils import escape_markdown
 
 def normalize_whitespace(text: str) -> str:
     """Replace multiple spaces with a single space and trim lines."""
@@ -7,10 +8,7 @@ def normalize_whitespace(text: str) -> str:
     
 def escape_markdown_chars(text: str) -> str:
     """Escape special markdown characters in plain text."""
-    if not text:
-        return ""
-    special_chars = r'\`*_{}[]()#+-.!|~'
-    return re.sub(f'([{re.escape(special_chars)}])', r'\\\1', text)
+    return escape_markdown(text)
 
 def normalize_markdown_output(markdown: str) -> str:
     """Normalize markdown output by cleaning up excessive newlines."""
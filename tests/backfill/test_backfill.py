@@ -0,0 +1,118 @@
+import pytest
+from slackformat.backfill.cache import ConversionCache, content_key
+from slackformat.backfill import runner as runner_module
+from slackformat.backfill.runner import BackfillRunner
+from slackformat.converters.blockkit_to_md import convert_blockkit_blocks_to_markdown
+from slackformat.converters.md_to_richtext import MdToRichtextConverter
+from slackformat.converters.md_to_blockkit import md_to_blockkit
+from slackformat.converters.message_converter import MessageConverter
+
+def _messages(count):
+    return [[{"type": "section", "text": {"type": "mrkdwn", "text": f"message {i % 3}"}}] for i in range(count)]
+
+class TestConversionCache:
+
+    def test_content_key_is_stable_and_namespaced(self):
+        assert content_key({"a": 1, "b": 2}) == content_key({"b": 2, "a": 1})
+        assert content_key({"a": 1}, "md") != content_key({"a": 1}, "rt")
+
+    def test_round_trip(self, tmp_path):
+        with ConversionCache(str(tmp_path / "cache.db")) as cache:
+            cache.write_batch([("k1", "text"), ("k2", {"type": "section"})], job="job", offset=2)
+            assert cache.get_many(["k1", "k2", "missing"]) == {"k1": "text", "k2": {"type": "section"}}
+            assert cache.get("missing") is None
+            assert cache.get_checkpoint("job") == 2
+            assert len(cache) == 2
+            cache.clear_checkpoint("job")
+            assert cache.get_checkpoint("job") == 0
+
+    def test_persists_across_connections(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        with ConversionCache(path) as cache:
+            cache.put("key", "value")
+        with ConversionCache(path) as cache:
+            assert cache.get("key") == "value"
+
+class TestBackfillRunner:
+
+    def test_converts_and_deduplicates(self, tmp_path):
+        runner = BackfillRunner(str(tmp_path / "cache.db"), batch_size=4)
+        messages = _messages(10)
+        results = list(runner.run(messages))
+        assert [offset for offset, _ in results] == list(range(10))
+        assert [output for _, output in results] == [convert_blockkit_blocks_to_markdown(m) for m in messages]
+        assert runner.stats.converted == 3
+        assert runner.stats.cache_hits == 7
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        messages = _messages(10)
+        first = BackfillRunner(path, job="archive", batch_size=4)
+        run = first.run(messages)
+        consumed = [next(run) for _ in range(6)]
+        run.close()  # simulate a crash part-way through the second batch
+        assert consumed[-1][0] == 5
+
+        second = BackfillRunner(path, job="archive", batch_size=4)
+        resumed = list(second.run(messages))
+        assert second.stats.resumed_from == 4
+        assert [offset for offset, _ in resumed] == list(range(4, 10))
+        assert second.stats.converted == 0
+
+    def test_cache_shared_across_jobs(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        BackfillRunner(path, job="one").run_all(_messages(3), lambda offset, output: None)
+        second = BackfillRunner(path, job="two")
+        outputs = []
+        stats = second.run_all(_messages(3), lambda offset, output: outputs.append(output))
+        assert stats.converted == 0
+        assert stats.cache_hits == 3
+        assert outputs == ["message 0", "message 1", "message 2"]
+
+    def test_converter_instances_use_separate_namespace(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        BackfillRunner(path, job="bk", converter=md_to_blockkit).run_all(["*x*"], lambda offset, output: None)
+        runner = BackfillRunner(path, job="rt", converter=MdToRichtextConverter())
+        results = list(runner.run(["*x*"]))
+        assert results[0][1]["elements"][0]["style"] == {"bold": True}
+        assert runner.stats.converted == 1
+
+    def test_namespace_is_versioned(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "cache.db")
+        runner = BackfillRunner(path)
+        assert runner.namespace.endswith(f"@{runner_module.__version__}/{runner_module.CACHE_SCHEMA}")
+        runner.run_all(_messages(1), lambda offset, output: None)
+        monkeypatch.setattr(runner_module, "CACHE_SCHEMA", "next")
+        upgraded = BackfillRunner(path, job="upgraded")
+        upgraded.run_all(_messages(1), lambda offset, output: None)
+        assert upgraded.stats.converted == 1
+        assert upgraded.stats.cache_hits == 0
+
+    def test_configured_instances_use_separate_namespace(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        markdown = BackfillRunner(path, job="md", converter=MessageConverter(("markdown",)))
+        messages = [{"blocks": blocks} for blocks in _messages(1)]
+        markdown.run_all(messages, lambda offset, output: None)
+        plain = BackfillRunner(path, job="plain", converter=MessageConverter(("plain",)))
+        assert plain.namespace != markdown.namespace
+        results = list(plain.run(messages))
+        assert results[0][1] == {"plain": "message 0"}
+        assert plain.stats.converted == 1
+        assert MdToRichtextConverter(intern=True).cache_identity() != MdToRichtextConverter().cache_identity()
+
+    def test_unnamed_callable_requires_namespace(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        with pytest.raises(ValueError):
+            BackfillRunner(path, converter=lambda blocks: "")
+        runner = BackfillRunner(path, converter=lambda blocks: "", namespace="empty")
+        assert runner.namespace == "empty"
+
+    def test_reset(self, tmp_path):
+        runner = BackfillRunner(str(tmp_path / "cache.db"))
+        list(runner.run(_messages(2)))
+        runner.reset()
+        assert [offset for offset, _ in runner.run(_messages(2))] == [0, 1]
+
+    def test_invalid_batch_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            BackfillRunner(str(tmp_path / "cache.db"), batch_size=0)
\ No newline at end of file
@@ -0,0 +1,88 @@
+import random
+import types
+import pytest
+import slackformat.__init_ as slackformat_exports
+from benchmarks.histogram import LatencyHistogram
+from benchmarks.loadtest import EXPORT_INPUTS, build_corpus, discover_converters, run
+from benchmarks.memory import detect_growth
+
+class TestLatencyHistogram:
+
+    def test_percentiles_within_precision(self):
+        rng = random.Random(0)
+        values = sorted(int(rng.expovariate(1 / 2000)) for _ in range(20000))
+        histogram = LatencyHistogram(precision=7)
+        for value in values:
+            histogram.record(value)
+        for percentile in (50, 90, 99, 99.9):
+            exact = values[int(len(values) * percentile / 100) - 1]
+            assert exact <= histogram.value_at_percentile(percentile) <= exact * (1 + 2 ** -7) + 1
+        assert histogram.max == values[-1]
+        assert histogram.value_at_percentile(100) == values[-1]
+
+    def test_merge(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in range(100):
+            first.record(value)
+            second.record(value + 1000)
+        first.merge(second)
+        assert first.count == 200
+        assert first.min == 0 and first.max == 1099
+        assert sum(count for _, _, count in first.buckets()) == 200
+        with pytest.raises(ValueError):
+            first.merge(LatencyHistogram(precision=3))
+
+class TestDetectGrowth:
+
+    def test_flat_noisy_series(self):
+        rng = random.Random(1)
+        times = list(range(100))
+        values = [50_000_000 + rng.randrange(4_000_000) for _ in times]
+        assert not detect_growth(times, values).growing
+
+    def test_steady_leak(self):
+        rng = random.Random(1)
+        times = list(range(100))
+        values = [50_000_000 + 200_000 * t + rng.randrange(1_000_000) for t in times]
+        report = detect_growth(times, values)
+        assert report.growing
+        assert 150_000 < report.bytes_per_sec < 250_000
+
+    def test_too_few_samples(self):
+        assert not detect_growth([0, 1, 2], [1, 2 ** 30, 2 ** 31]).growing
+
+class TestLoadTest:
+
+    def test_discovers_every_exported_function(self):
+        converters = discover_converters()
+        assert set(converters) == set(EXPORT_INPUTS)
+        corpus = build_corpus(5)
+        assert all(corpus[kind] for kind in EXPORT_INPUTS.values())
+
+    def test_unregistered_export_is_rejected(self):
+        module = types.SimpleNamespace(__all__=["new_converter"], new_converter=lambda payload: payload)
+        with pytest.raises(KeyError):
+            discover_converters(module)
+
+    def test_short_run_covers_all_converters(self):
+        result = run(duration=0.5, workers=2, corpus_size=20, sample_interval=0.05)
+        assert set(result.histograms) == set(EXPORT_INPUTS)
+        assert all(histogram.count for histogram in result.histograms.values())
+        assert not any(result.errors.values())
+        assert result.operations == sum(h.count for h in result.histograms.values())
+        assert len(result.memory) == 1
+
+    def test_flags_a_leaking_converter(self, monkeypatch):
+        leaked = []
+        original = slackformat_exports.md_to_richtext
+
+        def md_to_richtext(md_text):
+            leaked.append(b"x" * 100_000)
+            return original(md_text)
+
+        monkeypatch.setattr(slackformat_exports, "md_to_richtext", md_to_richtext)
+        weights = {name: 0 for name in EXPORT_INPUTS}
+        weights["md_to_richtext"] = 1
+        result = run(duration=1.0, rate=200, weights=weights, corpus_size=20, sample_interval=0.05)
+        assert set(result.histograms) == {"md_to_richtext"}
+        assert result.growing
\ No newline at end of file
@@ -0,0 +1,9 @@
+from benchmarks.resolver_roundtrips import run
+
+class TestResolverRoundtrips:
+
+    def test_batching_bounds_round_trips(self):
+        results = {result["strategy"]: result for result in run(documents=50, batch=10, latency=0)}
+        assert results["per-mention"]["round_trips"] >= 50
+        assert 1 <= results["batched, cold cache"]["round_trips"] <= 5
+        assert results["batched, warm cache"]["round_trips"] == 0
\ No newline at end of file
@@ -0,0 +1,51 @@
+import pytest
+from benchmarks.corpus import generate_samples, hypothesis_available
+from benchmarks.roundtrip import DIRECTIONS, run_matrix, format_matrix, main
+
+class TestCorpus:
+
+    def test_fallback_is_deterministic(self):
+        first = generate_samples("markdown", 10, seed=3, use_hypothesis=False)
+        second = generate_samples("markdown", 10, seed=3, use_hypothesis=False)
+        assert first == second
+        assert len(first) == 10
+
+    def test_fallback_kinds(self):
+        assert isinstance(generate_samples("markdown", 1, use_hypothesis=False)[0], str)
+        assert generate_samples("richtext", 1, use_hypothesis=False)[0]["type"].startswith("rich_text")
+        assert "type" in generate_samples("blockkit", 1, use_hypothesis=False)[0]
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            generate_samples("html", 1)
+
+    @pytest.mark.skipif(not hypothesis_available(), reason="hypothesis not installed")
+    def test_hypothesis_samples(self):
+        samples = generate_samples("richtext", 5, seed=1, use_hypothesis=True)
+        assert 0 < len(samples) <= 5
+        assert all(sample["type"].startswith("rich_text") for sample in samples)
+
+class TestRoundtripHarness:
+
+    def test_matrix_covers_every_direction(self):
+        results = run_matrix(samples=20, seed=0, use_hypothesis=False, repeat=1)
+        assert [result.direction for result in results] == [direction.name for direction in DIRECTIONS]
+        for result in results:
+            assert result.samples == 20
+            assert result.errors == 0
+            assert 0.0 <= result.fidelity <= 100.0
+            assert result.ops_per_sec > 0
+
+    def test_markdown_roundtrips(self):
+        results = run_matrix(samples=20, use_hypothesis=False, repeat=1, directions=["md_to_richtext"])
+        assert results[0].fidelity == 100.0
+
+    def test_format_matrix(self):
+        results = run_matrix(samples=5, use_hypothesis=False, repeat=1, directions=["md_to_blockkit"])
+        table = format_matrix(results)
+        assert "fidelity %" in table
+        assert "md_to_blockkit" in table
+
+    def test_main_json(self, capsys):
+        assert main(["--samples", "5", "--repeat", "1", "--no-hypothesis", "--json"]) == 0
+        assert '"direction": "md_to_richtext"' in capsys.readouterr().out
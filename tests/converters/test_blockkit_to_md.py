@@ -45,9 +45,51 @@ class TestBlockkitToMdConverter:
                 "elements": [{"type": "rich_text_section", "elements": [{"type": "text", "text": "Item"}]}]
             }]
         }
-        # Note: This test requires a more complete implementation of blockkit_to_markdown
-        # For now, it will likely extract the text content.
-        pass # Placeholder for a more advanced test
+        assert blockkit_to_markdown(blockkit) == "- Item"
+
+    def test_rich_text_all_child_types(self):
+        blockkit = {
+            "type": "rich_text",
+            "elements": [
+                {"type": "rich_text_section", "elements": [{"type": "text", "text": "Intro"}]},
+                {
+                    "type": "rich_text_list", "style": "ordered",
+                    "elements": [
+                        {"type": "rich_text_section", "elements": [{"type": "text", "text": "One"}]},
+                        {"type": "rich_text_section", "elements": [{"type": "text", "text": "Two"}]},
+                    ]
+                },
+                {"type": "rich_text_quote", "elements": [{"type": "text", "text": "Quoted\ntext"}]},
+                {"type": "rich_text_preformatted", "elements": [{"type": "text", "text": "x = 1"}]},
+            ]
+        }
+        assert blockkit_to_markdown(blockkit) == "Intro\n\n1. One\n2. Two\n\n> Quoted\n> text\n\n```\nx = 1\n```"
+
+    def test_rich_text_nested_list_indent(self):
+        blockkit = {
+            "type": "rich_text",
+            "elements": [{
+                "type": "rich_text_list", "style": "bullet", "indent": 1,
+                "elements": [{"type": "rich_text_section", "elements": [{"type": "text", "text": "Nested"}]}]
+            }]
+        }
+        assert blockkit_to_markdown(blockkit) == "    - Nested"
+
+    def test_rich_text_mentions_and_dates(self):
+        blockkit = {
+            "type": "rich_text",
+            "elements": [{
+                "type": "rich_text_section",
+                "elements": [
+                    {"type": "user", "user_id": "U1"},
+                    {"type": "channel", "channel_id": "C1"},
+                    {"type": "usergroup", "usergroup_id": "S1"},
+                    {"type": "broadcast", "range": "channel"},
+                    {"type": "date", "timestamp": 1720000000, "format": "{date_short}", "fallback": "Jul 3"},
+                ]
+            }]
+        }
+        assert blockkit_to_markdown(blockkit) == "<@U1><#C1><!subteam^S1><!channel><!date^1720000000^{date_short}|Jul 3>"
 
     def test_multiple_blocks_conversion(self):
         blocks = [
@@ -0,0 +1,82 @@
+import pytest
+from slackformat.converters.blockkit_to_plain import (
+    SearchDocumentConverter,
+    blockkit_to_plain,
+    extract_search_document,
+    iter_search_documents,
+)
+
+BLOCKS = [
+    {"type": "header", "text": {"type": "plain_text", "text": "Release Notes"}},
+    {"type": "section", "text": {"type": "mrkdwn", "text": "Ship *v2* :tada: with <@U1> in <#C1|eng>\n• see <https://a.com/notes|the notes>"}},
+    {"type": "divider"},
+    {
+        "type": "rich_text",
+        "elements": [
+            {"type": "rich_text_section", "elements": [
+                {"type": "emoji", "name": "rocket"},
+                {"type": "text", "text": " thanks ", "style": {"bold": True}},
+                {"type": "usergroup", "usergroup_id": "S1"},
+            ]},
+            {"type": "rich_text_list", "style": "bullet", "elements": [
+                {"type": "rich_text_section", "elements": [{"type": "link", "url": "https://b.com"}]},
+            ]},
+        ]
+    },
+]
+
+class TestBlockkitToPlainConverter:
+
+    def test_plain_text(self):
+        assert blockkit_to_plain(BLOCKS) == (
+            "Release Notes\nShip v2 :tada: with @U1 in #eng\nsee the notes\n:rocket: thanks @S1\nhttps://b.com"
+        )
+
+    def test_single_block(self):
+        assert blockkit_to_plain({"type": "section", "text": {"type": "mrkdwn", "text": "_hi_"}}) == "hi"
+
+    def test_section_fields_and_context(self):
+        blocks = [
+            {"type": "section", "fields": [{"type": "mrkdwn", "text": "*A*"}, {"type": "plain_text", "text": "B"}]},
+            {"type": "context", "elements": [{"type": "image", "alt_text": "x"}, {"type": "mrkdwn", "text": "`C`"}]},
+        ]
+        assert blockkit_to_plain(blocks) == "A\nB\nC"
+
+    def test_empty(self):
+        assert blockkit_to_plain([]) == ""
+
+class TestSearchDocumentConverter:
+
+    def test_entities(self):
+        document = extract_search_document(BLOCKS)
+        assert document.users == ["U1"]
+        assert document.channels == ["C1"]
+        assert document.usergroups == ["S1"]
+        assert document.links == ["https://a.com/notes", "https://b.com"]
+        assert document.emoji == ["tada", "rocket"]
+
+    def test_tokens(self):
+        document = extract_search_document(BLOCKS[:2])
+        assert document.tokens == ["release", "notes", "ship", "v2", "tada", "with", "u1", "in", "eng", "see", "the", "notes"]
+
+    def test_emoji_shortcode_ignores_times_and_code(self):
+        blocks = {"type": "section", "text": {"type": "mrkdwn", "text": "at 10:30:45 `:nope:` :ok_hand:"}}
+        assert extract_search_document(blocks).emoji == ["ok_hand"]
+
+    def test_options_disable_extraction(self):
+        converter = SearchDocumentConverter(tokenize=False, entities=False)
+        document = converter.convert(BLOCKS)
+        assert document.tokens == []
+        assert document.users == []
+        assert document.text == blockkit_to_plain(BLOCKS)
+
+    def test_preserve_case(self):
+        converter = SearchDocumentConverter(lowercase=False, entities=False)
+        assert converter.convert(BLOCKS[0]).tokens == ["Release", "Notes"]
+
+    def test_streaming(self):
+        documents = iter_search_documents(iter([BLOCKS[0], BLOCKS[3]]))
+        assert next(documents).text == "Release Notes"
+        assert next(documents).usergroups == ["S1"]
+        with pytest.raises(StopIteration):
+            next(documents)
\ No newline at end of file
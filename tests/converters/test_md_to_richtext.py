@@ -1,5 +1,7 @@
 import pytest
 from slackformat.converters.md_to_richtext import md_to_richtext
+from slackformat.formatters.plain_formatter import format_rich_text_section_to_plain
+from slackformat.parsers.richtext_parser import parse_rich_text_to_mrkdwn
 
 class TestMdToRichtextConverter:
     
@@ -58,4 +60,27 @@ class TestMdToRichtextConverter:
             "type": "rich_text_section",
             "elements": [{"type": "text", "text": "*unclosed bold"}]
         }
-        assert result == expected
\ No newline at end of file
+        assert result == expected
+
+    def test_slack_mention_tokens(self):
+        result = md_to_richtext("<@U1> <#C1|eng> <!subteam^S1> <!here> <!date^1720000000^{date_short}|Jul 3>")
+        elements = [elem for elem in result["elements"] if elem["type"] != "text"]
+        assert elements == [
+            {"type": "user", "user_id": "U1"},
+            {"type": "channel", "channel_id": "C1", "fallback": "eng"},
+            {"type": "usergroup", "usergroup_id": "S1"},
+            {"type": "broadcast", "range": "here"},
+            {"type": "date", "timestamp": 1720000000, "format": "{date_short}", "fallback": "Jul 3"},
+        ]
+
+    def test_mention_labels_round_trip(self):
+        text = "<@U1|bob> <#C1|general> <!subteam^S1|@eng>"
+        result = md_to_richtext(text)
+        mentions = [elem for elem in result["elements"] if elem["type"] != "text"]
+        assert [elem["fallback"] for elem in mentions] == ["bob", "general", "@eng"]
+        assert format_rich_text_section_to_plain(result) == "@bob #general @eng"
+        assert parse_rich_text_to_mrkdwn(result) == text
+
+    def test_link_with_label(self):
+        result = md_to_richtext("<https://a.com|A site>")
+        assert result["elements"] == [{"type": "link", "url": "https://a.com", "text": "A site"}]
\ No newline at end of file
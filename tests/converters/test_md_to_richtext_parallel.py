@@ -0,0 +1,74 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from slackformat.converters import md_to_richtext
+from slackformat.converters.md_to_richtext import MdToRichtextConverter, _split_at_lines
+
+DOCUMENT = "\n".join(
+    f"• item *{i}*" if i % 3 == 0 else (f"line _{i}_ <@U{i}>" if i % 3 == 1 else "")
+    for i in range(600)
+)
+
+class TestParallelMdToRichtext:
+
+    def test_split_at_lines(self):
+        text = "a\nbb\n\nccc\nd"
+        chunks = _split_at_lines(text, 3)
+        assert "\n".join(chunks) == text
+        assert len(chunks) > 1
+
+    def test_thread_executor_matches_sequential(self):
+        sequential = MdToRichtextConverter(parallel_threshold=None)
+        with ThreadPoolExecutor(4) as executor:
+            parallel = MdToRichtextConverter(parallel_threshold=100, executor=executor)
+            assert parallel.convert(DOCUMENT) == sequential.convert(DOCUMENT)
+
+    def test_process_pool_matches_sequential(self):
+        sequential = MdToRichtextConverter(parallel_threshold=None)
+        parallel = MdToRichtextConverter(parallel_threshold=100, max_workers=2)
+        try:
+            assert parallel.convert(DOCUMENT) == sequential.convert(DOCUMENT)
+        finally:
+            parallel.close()
+
+    def test_single_section_result_shape(self):
+        with ThreadPoolExecutor(2) as executor:
+            parallel = MdToRichtextConverter(parallel_threshold=1, executor=executor)
+            assert parallel.convert("just *one* line") == MdToRichtextConverter().convert("just *one* line")
+
+    def test_parallel_parsing_is_opt_in(self):
+        class FailingExecutor(ThreadPoolExecutor):
+            def map(self, *args, **kwargs):
+                raise AssertionError("executor should not be used")
+
+        with FailingExecutor(1) as executor:
+            MdToRichtextConverter(executor=executor).convert(DOCUMENT)
+
+    def test_below_threshold_stays_sequential(self):
+        class FailingExecutor(ThreadPoolExecutor):
+            def map(self, *args, **kwargs):
+                raise AssertionError("executor should not be used")
+
+        with FailingExecutor(1) as executor:
+            converter = MdToRichtextConverter(parallel_threshold=len(DOCUMENT) + 1, executor=executor)
+            converter.convert(DOCUMENT)
+
+    def test_parallel_uses_default_threshold(self, monkeypatch):
+        class FailingExecutor(ThreadPoolExecutor):
+            def map(self, *args, **kwargs):
+                raise AssertionError("executor should not be used")
+
+        assert len(DOCUMENT) < md_to_richtext.DEFAULT_PARALLEL_THRESHOLD
+        with FailingExecutor(1) as executor:
+            MdToRichtextConverter(parallel=True, executor=executor).convert(DOCUMENT)
+
+        monkeypatch.setattr(md_to_richtext, "DEFAULT_PARALLEL_THRESHOLD", 100)
+        with ThreadPoolExecutor(2) as executor:
+            converter = MdToRichtextConverter(parallel=True, executor=executor)
+            assert converter.convert(DOCUMENT) == MdToRichtextConverter().convert(DOCUMENT)
+            assert converter._use_parallel(DOCUMENT)
+
+    def test_interning_with_parallel_parse(self):
+        with ThreadPoolExecutor(2) as executor:
+            converter = MdToRichtextConverter(intern=True, parallel_threshold=100, executor=executor)
+            result = converter.convert(DOCUMENT)
+        assert result == MdToRichtextConverter().convert(DOCUMENT)
\ No newline at end of file
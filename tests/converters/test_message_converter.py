@@ -0,0 +1,113 @@
+import pytest
+from slackformat.converters.message_converter import MessageConverter, convert_message
+from slackformat.converters.blockkit_to_md import convert_blockkit_blocks_to_markdown
+from slackformat.converters.blockkit_to_plain import blockkit_to_plain
+from slackformat.converters.blockkit_to_richtext import BlockkitToRichtextConverter
+from slackformat.converters.md_to_richtext import MdToRichtextConverter
+
+PAYLOAD = {
+    "type": "message",
+    "text": "fallback text",
+    "blocks": [
+        {"type": "header", "text": {"type": "plain_text", "text": "Deploy"}},
+        {"type": "section", "text": {"type": "mrkdwn", "text": "Build *passed* for <https://ci.example.com|ci>"}},
+        {"type": "divider"},
+        {
+            "type": "rich_text",
+            "elements": [{
+                "type": "rich_text_section",
+                "elements": [{"type": "user", "user_id": "U1"}, {"type": "text", "text": " approved"}]
+            }]
+        },
+    ],
+    "attachments": [{
+        "pretext": "Details",
+        "fields": [{"title": "Env", "value": "prod"}],
+        "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": "_attached_"}}],
+    }],
+}
+
+class TestMessageConverter:
+
+    def test_all_targets(self):
+        result = convert_message(PAYLOAD)
+        assert set(result) == {"markdown", "richtext", "plain"}
+        assert result["richtext"]["type"] == "rich_text"
+        assert result["plain"] == "Deploy\nBuild passed for ci\n@U1 approved\nDetails\nEnv\nprod\nattached"
+
+    def test_markdown_matches_block_conversion(self):
+        result = convert_message(PAYLOAD, targets=("markdown",))
+        assert list(result) == ["markdown"]
+        assert result["markdown"].startswith(convert_blockkit_blocks_to_markdown(PAYLOAD["blocks"]))
+        assert result["markdown"].endswith("Details\n\n*Env*\nprod\n\n_attached_")
+
+    def test_richtext_skips_empty_blocks(self):
+        result = convert_message(PAYLOAD, targets=["richtext"])
+        elements = result["richtext"]["elements"]
+        assert elements[0]["elements"][0] == {"type": "text", "text": "Deploy", "style": {"bold": True}}
+        assert all(section["elements"] for section in elements)
+        assert elements[2]["elements"][0] == {"type": "user", "user_id": "U1"}
+
+    def test_text_used_without_blocks(self):
+        result = convert_message({"text": "*hi* there"}, targets=("markdown", "plain"))
+        assert result == {"markdown": "*hi* there", "plain": "hi there"}
+
+    def test_attachment_fallback(self):
+        result = convert_message({"attachments": [{"fallback": "legacy"}]}, targets=("plain",))
+        assert result["plain"] == "legacy"
+
+    def test_attachment_title_link(self):
+        payload = {"attachments": [{"title": "Report", "title_link": "https://a.com"}]}
+        result = convert_message(payload, targets=("markdown", "plain"))
+        assert result == {"markdown": "<https://a.com|Report>", "plain": "Report"}
+
+    def test_attachment_titles_are_escaped(self):
+        payload = {"attachments": [{"title": "T > x", "title_link": "http://a", "fields": [{"title": "a < b", "value": "v"}]}]}
+        result = convert_message(payload, targets=("plain",))
+        assert result["plain"] == "T > x\na < b\nv"
+
+    def test_empty_payload(self):
+        assert convert_message({}) == {"markdown": "", "richtext": {"type": "rich_text", "elements": []}, "plain": ""}
+
+    def test_unknown_target(self):
+        with pytest.raises(ValueError):
+            MessageConverter(targets=("html",))
+
+    def test_stats_count_messages(self):
+        converter = MessageConverter()
+        converter.convert_many([PAYLOAD, PAYLOAD])
+        assert converter.stats().calls == 2
+
+    def test_plain_matches_blockkit_to_plain(self):
+        blocks = [
+            {"type": "section", "fields": [{"type": "mrkdwn", "text": "*A*"}]},
+            {"type": "image", "image_url": "https://a.com/cat.png", "alt_text": "cat"},
+            {"type": "context", "elements": [
+                {"type": "image", "image_url": "https://a.com/x.png", "alt_text": "x"},
+                {"type": "mrkdwn", "text": "C"},
+            ]},
+        ]
+        assert convert_message({"blocks": blocks}, targets=("plain",))["plain"] == "A\ncat\nC"
+        assert convert_message({"blocks": PAYLOAD["blocks"]})["plain"] == blockkit_to_plain(PAYLOAD["blocks"])
+
+    def test_plain_shares_the_richtext_parser(self):
+        parser = MdToRichtextConverter()
+        converter = MessageConverter(("plain",), richtext_converter=BlockkitToRichtextConverter(md_converter=parser))
+        result = converter.convert({"blocks": [{"type": "section", "fields": [{"type": "mrkdwn", "text": "*hi*"}]}]})
+        assert result == {"plain": "hi"}
+        assert parser.stats().calls == 1
+
+    def test_mrkdwn_parsed_once_per_block(self, monkeypatch):
+        calls = []
+        original = MdToRichtextConverter._convert
+
+        def counting(self, md_text):
+            calls.append(md_text)
+            return original(self, md_text)
+
+        monkeypatch.setattr(MdToRichtextConverter, "_convert", counting)
+        converter = MessageConverter()
+        context = {"type": "context", "elements": [{"type": "mrkdwn", "text": "by *ops*"}]}
+        result = converter.convert({"blocks": PAYLOAD["blocks"] + [context]})
+        assert calls == ["Build *passed* for <https://ci.example.com|ci>", "by *ops*"]
+        assert result["plain"].endswith("\nby ops")
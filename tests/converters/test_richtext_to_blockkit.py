@@ -47,6 +47,22 @@ class TestRichtextToBlockkitConverter:
         result = richtext_to_blockkit(richtext)
         assert result["text"]["text"] == "<@U12345>"
 
+    def test_channel_and_usergroup_mentions(self):
+        richtext = {
+            "type": "rich_text_section",
+            "elements": [
+                {"type": "channel", "channel_id": "C1"},
+                {"type": "text", "text": " "},
+                {"type": "usergroup", "usergroup_id": "S1"},
+            ]
+        }
+        result = richtext_to_blockkit(richtext)
+        assert result["text"]["text"] == "<#C1> <!subteam^S1>"
+
+    def test_quote(self):
+        richtext = {"type": "rich_text_quote", "elements": [{"type": "text", "text": "quoted"}]}
+        assert richtext_to_blockkit(richtext)["text"]["text"] == "> quoted"
+
     def test_bullet_list(self):
         richtext = {
             "type": "rich_text_list",
@@ -33,4 +33,18 @@ class TestRichtextToMdConverter:
                 {"type": "rich_text_section", "elements": [{"type": "text", "text": "Item 2"}]},
             ]
         }
-        assert richtext_to_markdown(richtext) == "- Item 1\n- Item 2"
\ No newline at end of file
+        assert richtext_to_markdown(richtext) == "- Item 1\n- Item 2"
+
+    def test_quote(self):
+        richtext = {"type": "rich_text_quote", "elements": [{"type": "text", "text": "wise", "style": {"italic": True}}]}
+        assert richtext_to_markdown(richtext) == "> *wise*"
+
+    def test_preformatted_ignores_styles(self):
+        richtext = {
+            "type": "rich_text_preformatted",
+            "elements": [
+                {"type": "text", "text": "run ", "style": {"bold": True}},
+                {"type": "link", "url": "https://a.com"},
+            ]
+        }
+        assert richtext_to_markdown(richtext) == "```\nrun https://a.com\n```"
\ No newline at end of file
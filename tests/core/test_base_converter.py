@@ -0,0 +1,92 @@
+import gc
+import threading
+from datetime import datetime
+import pytest
+from slackformat.core.base_converter import BaseConverter, ConverterStats, payload_size
+from slackformat.converters.md_to_richtext import MdToRichtextConverter, md_to_richtext
+from slackformat.converters.md_to_blockkit import MdToBlockkitConverter
+from slackformat.converters.blockkit_to_md import BlockkitToMdConverter, blockkit_to_markdown
+
+class TestBaseConverter:
+
+    def test_cannot_instantiate_abstract(self):
+        with pytest.raises(TypeError):
+            BaseConverter()
+
+    def test_convert_matches_function(self):
+        converter = MdToRichtextConverter()
+        md = "Hello *bold*\n• item"
+        assert converter.convert(md) == md_to_richtext(md)
+
+    def test_convert_many(self):
+        converter = MdToRichtextConverter()
+        result = converter.convert_many(["*a*", "_b_"])
+        assert result[0]["elements"][0]["style"] == {"bold": True}
+        assert result[1]["elements"][0]["style"] == {"italic": True}
+
+    def test_iter_convert_is_lazy(self):
+        converter = MdToRichtextConverter()
+        results = converter.iter_convert(iter(["one", "two"]))
+        assert converter.stats().calls == 0
+        assert next(results)["elements"][0]["text"] == "one"
+        assert converter.stats().calls == 1
+
+    def test_stats(self):
+        converter = MdToBlockkitConverter()
+        result = converter.convert("héllo")
+        stats = converter.stats()
+        assert isinstance(stats, ConverterStats)
+        assert stats.calls == 1
+        assert stats.bytes_in == len("héllo".encode("utf-8"))
+        assert stats.bytes_out == payload_size(result)
+        assert stats.seconds >= 0
+
+    def test_stats_disabled(self):
+        converter = MdToRichtextConverter(collect_stats=False)
+        converter.convert("text")
+        assert converter.stats() == ConverterStats(0, 0, 0, 0.0)
+
+    def test_reset_stats(self):
+        converter = BlockkitToMdConverter()
+        converter.convert_blocks([{"type": "divider"}, {"type": "divider"}])
+        assert converter.stats().calls == 2
+        converter.reset_stats()
+        assert converter.stats().calls == 0
+
+    def test_shared_across_threads(self):
+        converter = MdToRichtextConverter()
+        barrier = threading.Barrier(4)
+
+        def worker():
+            barrier.wait()
+            for _ in range(250):
+                assert converter.convert("*bold*")["elements"][0]["text"] == "bold"
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert converter.stats().calls == 1000
+
+    def test_stats_never_raise_on_unserializable_input(self):
+        block = {"type": "divider", "ts": datetime(2024, 1, 1)}
+        assert blockkit_to_markdown(block) == "---"
+        converter = BlockkitToMdConverter()
+        assert converter.convert(block) == "---"
+        assert converter.stats().calls == 1
+        circular = {"type": "divider"}
+        circular["self"] = circular
+        assert payload_size(circular) == 0
+
+    def test_exited_threads_release_counters(self):
+        converter = MdToRichtextConverter()
+        for _ in range(50):
+            thread = threading.Thread(target=converter.convert, args=("*bold*",))
+            thread.start()
+            thread.join()
+        gc.collect()
+        assert len(converter._counters) <= 1
+        assert converter.stats().calls == 50
+        converter.reset_stats()
+        assert converter.stats().calls == 0
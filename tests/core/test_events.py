@@ -0,0 +1,163 @@
+import io
+import pytest
+from slackformat.core.events import Event, TEXT, USER, START_SECTION, END_SECTION, END_LIST, map_events
+from slackformat.core.exceptions import ParsingError
+from slackformat.parsers.markdown_parser import iter_markdown_events
+from slackformat.parsers.richtext_parser import iter_rich_text_events, parse_rich_text_to_mrkdwn
+from slackformat.parsers.blockkit_parser import iter_blockkit_events
+from slackformat.formatters.event_formatter import (
+    build_rich_text_from_events,
+    iter_event_blocks,
+    iter_events_to_blockkit,
+    render_events_to_md,
+    render_events_to_mrkdwn,
+    render_events_to_plain,
+)
+from slackformat.utils.event_filters import redact, replace_mentions
+from slackformat.converters.md_to_richtext import md_to_richtext
+from slackformat.converters.richtext_to_md import richtext_to_markdown
+from slackformat.converters.blockkit_to_md import blockkit_to_markdown, convert_blockkit_blocks_to_markdown
+from slackformat.converters.blockkit_to_richtext import blockkit_to_richtext
+from slackformat.converters.blockkit_to_plain import blockkit_to_plain
+from slackformat.utils.escape_utils import escape_mrkdwn
+from benchmarks.corpus import generate_samples
+
+RICH_TEXT = {
+    "type": "rich_text",
+    "elements": [
+        {"type": "rich_text_section", "elements": [
+            {"type": "text", "text": "Hi "},
+            {"type": "user", "user_id": "U1"},
+            {"type": "text", "text": " see ", "style": {"bold": True}},
+            {"type": "link", "url": "https://a.com", "text": "docs"},
+        ]},
+        {"type": "rich_text_list", "style": "ordered", "indent": 1, "elements": [
+            {"type": "rich_text_section", "elements": [{"type": "text", "text": "one"}]},
+            {"type": "rich_text_section", "elements": [{"type": "emoji", "name": "tada"}]},
+        ]},
+        {"type": "rich_text_quote", "elements": [{"type": "text", "text": "quoted"}]},
+        {"type": "rich_text_preformatted", "elements": [{"type": "text", "text": "code"}]},
+    ]
+}
+
+class TestEventProducers:
+
+    def test_markdown_events(self):
+        events = list(iter_markdown_events("*hi*\n• item"))
+        assert events[0] == Event(START_SECTION)
+        assert events[1] == Event(TEXT, "hi", {"bold": True})
+        assert events[-1] == Event(END_LIST)
+
+    def test_markdown_from_line_iterable(self):
+        source = io.StringIO("line one\n\n*two*\n")
+        assert build_rich_text_from_events(iter_markdown_events(source))["elements"] == (
+            md_to_richtext("line one\n\n*two*")["elements"]
+        )
+
+    def test_rich_text_round_trip(self):
+        assert build_rich_text_from_events(iter_rich_text_events(RICH_TEXT)) == RICH_TEXT
+
+    def test_blockkit_events(self):
+        blocks = [
+            {"type": "header", "text": {"type": "plain_text", "text": "Title"}},
+            {"type": "divider"},
+            {"type": "section", "text": {"type": "mrkdwn", "text": "some text"}},
+            {"type": "context", "elements": [{"type": "mrkdwn", "text": "small"}]},
+            {"type": "image", "image_url": "https://a.com/i.png", "alt_text": "Alt"},
+            RICH_TEXT,
+        ]
+        assert "".join(render_events_to_md(iter_blockkit_events(blocks))) == convert_blockkit_blocks_to_markdown(blocks)
+
+    def test_blockkit_markdown_normalizes_mrkdwn_sections(self):
+        # mrkdwn is parsed into the stream, so it renders like the rich text path
+        # rather than being passed through verbatim as blockkit_to_markdown does.
+        section = {"type": "section", "text": {"type": "mrkdwn", "text": "• a *b*\nc"}}
+        streamed = "".join(render_events_to_md(iter_blockkit_events(section)))
+        assert streamed == "- a **b**\n\nc"
+        assert streamed == richtext_to_markdown(blockkit_to_richtext(section))
+        assert blockkit_to_markdown(section) == "• a *b*\nc"
+
+    def test_blockkit_context_mrkdwn_is_parsed(self):
+        context = {"type": "context", "elements": [{"type": "mrkdwn", "text": "by <@U1> &amp; *co*"}]}
+        assert list(iter_events_to_blockkit(iter_blockkit_events(context))) == [context]
+        assert "".join(render_events_to_plain(iter_blockkit_events(context))) == "by @U1 & co"
+        renamed = replace_mentions(iter_blockkit_events(context), {("user", "U1"): "jane"})
+        assert "".join(render_events_to_plain(renamed)) == "by @jane & co"
+
+    def test_blockkit_stream_matches_tree_converters_on_corpus(self):
+        for block in generate_samples("blockkit", 300, seed=0, use_hypothesis=False):
+            block_type = block["type"]
+            richtext = blockkit_to_richtext(block)
+            streamed_md = "".join(render_events_to_md(iter_blockkit_events(block)))
+            streamed_mrkdwn = "".join(render_events_to_mrkdwn(iter_blockkit_events(block)))
+            if block_type == "context":
+                assert streamed_md == f"_{richtext_to_markdown(richtext)}_"
+                assert streamed_mrkdwn == f"_{parse_rich_text_to_mrkdwn(richtext)}_"
+            elif block_type == "header":
+                assert streamed_md == blockkit_to_markdown(block)
+                assert streamed_mrkdwn == f"*{escape_mrkdwn(blockkit_to_plain(block))}*"
+            else:
+                if block_type == "section" and block["text"]["type"] == "mrkdwn":
+                    assert streamed_md == richtext_to_markdown(richtext)
+                else:
+                    assert streamed_md == blockkit_to_markdown(block)
+                assert streamed_mrkdwn == parse_rich_text_to_mrkdwn(richtext)
+            assert "".join(render_events_to_plain(iter_blockkit_events(block))) == blockkit_to_plain(block)
+
+class TestEventRenderers:
+
+    def test_markdown_matches_tree_renderer(self):
+        assert "".join(render_events_to_md(iter_rich_text_events(RICH_TEXT))) == richtext_to_markdown(RICH_TEXT)
+
+    def test_mrkdwn_matches_tree_renderer(self):
+        assert "".join(render_events_to_mrkdwn(iter_rich_text_events(RICH_TEXT))) == parse_rich_text_to_mrkdwn(RICH_TEXT)
+
+    def test_plain(self):
+        assert "".join(render_events_to_plain(iter_markdown_events("*a* <@U1>\n• b"))) == "a @U1\nb"
+
+    def test_output_is_incremental(self):
+        def source():
+            yield from iter_markdown_events("first")
+            raise RuntimeError("source exhausted too early")
+        chunks = render_events_to_md(source())
+        assert next(chunks) == "first"
+
+    def test_blockkit_output(self):
+        blocks = list(iter_events_to_blockkit(iter_markdown_events("*a*\nb")))
+        assert blocks == [
+            {"type": "section", "text": {"type": "mrkdwn", "text": "*a*"}},
+            {"type": "section", "text": {"type": "mrkdwn", "text": "b"}},
+        ]
+
+    def test_bare_inline_event(self):
+        assert list(iter_event_blocks([Event(TEXT, "x")])) == [
+            {"type": "rich_text_section", "elements": [{"type": "text", "text": "x"}]}
+        ]
+
+    def test_unbalanced_streams(self):
+        with pytest.raises(ParsingError):
+            list(iter_event_blocks([Event(END_SECTION)]))
+        with pytest.raises(ParsingError):
+            list(iter_event_blocks([Event(START_SECTION)]))
+
+class TestEventFilters:
+
+    def test_redact(self):
+        events = redact(iter_markdown_events("call 555-1234 or <https://x.com/555-1234|555-1234>"), r"\d{3}-\d{4}")
+        assert "".join(render_events_to_mrkdwn(events)) == "call [redacted] or <https://x.com/[redacted]|[redacted]>"
+
+    def test_replace_mentions(self):
+        names = {("user", "U1"): "jane", ("channel", "C1"): "general"}
+        events = replace_mentions(iter_markdown_events("<@U1> in <#C1> and <@U2>"), names)
+        assert "".join(render_events_to_md(events)) == "@jane in #general and <@U2>"
+
+    def test_replace_mentions_keys_by_kind(self):
+        names = {("user", "X1"): "jane", ("channel", "X1"): "general"}
+        events = replace_mentions(iter_markdown_events("<@X1> <#X1> <!subteam^X1>"), names)
+        assert "".join(render_events_to_md(events)) == "@jane #general <!subteam^X1>"
+
+    def test_map_events(self):
+        def drop_users(event):
+            return None if event.kind == USER else event
+        events = map_events(iter_markdown_events("a <@U1> b"), drop_users)
+        assert "".join(render_events_to_plain(events)) == "a  b"
\ No newline at end of file
@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+from slackformat.resolvers.dict_resolver import DictResolver, AsyncDictResolver
+from slackformat.resolvers.mention_renderer import MentionRenderer
+from slackformat.resolvers.ttl_cache import TTLCache
+
+def _doc(*elements):
+    return {"type": "rich_text_section", "elements": list(elements)}
+
+USER_1 = {"type": "user", "user_id": "U1"}
+USER_2 = {"type": "user", "user_id": "U2"}
+CHANNEL = {"type": "channel", "channel_id": "C1"}
+SPACE = {"type": "text", "text": " "}
+
+def _resolver():
+    return DictResolver(users={"U1": "jane", "U2": "sam"}, channels={"C1": "general"})
+
+class TestTTLCache:
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2)
+        cache.set_many([("a", 1), ("b", 2)])
+        cache.get_many(["a"])
+        cache.set_many([("c", 3)])
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+    def test_expiry(self):
+        now = [0.0]
+        cache = TTLCache(ttl=10, clock=lambda: now[0])
+        cache.set_many([("a", 1)])
+        now[0] = 9.9
+        assert cache.get_many(["a"]) == {"a": 1}
+        now[0] = 10.0
+        assert cache.get_many(["a"]) == {}
+        assert len(cache) == 0
+
+class TestMentionRenderer:
+
+    def test_renders_names_inline(self):
+        renderer = MentionRenderer(_resolver())
+        assert renderer.render(_doc(USER_1, {"type": "text", "text": " in "}, CHANNEL)) == "@jane in #general"
+
+    def test_one_round_trip_per_batch(self):
+        resolver = _resolver()
+        renderer = MentionRenderer(resolver, target="plain")
+        documents = [_doc(USER_1, SPACE, CHANNEL), _doc(USER_2), _doc(USER_1, SPACE, USER_2)]
+        assert renderer.render_many(documents) == ["@jane #general", "@sam", "@jane @sam"]
+        assert resolver.calls == 1
+        assert resolver.ids_requested == 3
+
+    def test_cache_avoids_round_trips(self):
+        resolver = _resolver()
+        renderer = MentionRenderer(resolver)
+        renderer.render_many([_doc(USER_1)])
+        renderer.render_many([_doc(USER_1), _doc(USER_1)])
+        assert resolver.calls == 1
+        renderer.render(_doc(USER_2))
+        assert resolver.calls == 2
+        assert renderer.round_trips == 2
+
+    def test_unknown_ids_are_cached_and_left_raw(self):
+        resolver = _resolver()
+        renderer = MentionRenderer(resolver, target="mrkdwn")
+        assert renderer.render(_doc({"type": "user", "user_id": "U9"})) == "<@U9>"
+        renderer.render(_doc({"type": "user", "user_id": "U9"}))
+        assert resolver.calls == 1
+
+    def test_expired_entries_are_refetched(self):
+        now = [0.0]
+        resolver = _resolver()
+        renderer = MentionRenderer(resolver, cache=TTLCache(ttl=60, clock=lambda: now[0]))
+        renderer.render(_doc(USER_1))
+        now[0] = 61
+        renderer.render(_doc(USER_1))
+        assert resolver.calls == 2
+
+    def test_markdown_and_blockkit_sources(self):
+        resolver = _resolver()
+        assert MentionRenderer(resolver, source="markdown", target="mrkdwn").render("hi <@U1>") == "hi @jane"
+        block = {"type": "section", "text": {"type": "mrkdwn", "text": "<#C1>"}}
+        assert MentionRenderer(resolver, source="blockkit").render([block]) == "#general"
+
+    def test_same_id_different_kinds(self):
+        resolver = DictResolver(users={"X1": "jane"}, channels={"X1": "general"})
+        document = _doc({"type": "user", "user_id": "X1"}, SPACE, {"type": "channel", "channel_id": "X1"})
+        renderer = MentionRenderer(resolver, target="plain")
+        assert renderer.render(document) == "@jane #general"
+        assert renderer.render(document) == "@jane #general"
+        assert resolver.calls == 1
+
+    def test_no_mentions_no_round_trip(self):
+        resolver = _resolver()
+        MentionRenderer(resolver).render(_doc({"type": "text", "text": "hello"}))
+        assert resolver.calls == 0
+
+    def test_async_resolver(self):
+        resolver = AsyncDictResolver(users={"U1": "jane"})
+        renderer = MentionRenderer(resolver)
+        result = asyncio.run(renderer.render_many_async([_doc(USER_1), _doc(USER_1)]))
+        assert result == ["@jane", "@jane"]
+        assert resolver.calls == 1
+        with pytest.raises(TypeError):
+            renderer.render(_doc(USER_1))
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            MentionRenderer(_resolver(), source="html")
+        with pytest.raises(ValueError):
+            MentionRenderer(_resolver(), target="html")
\ No newline at end of file
@@ -0,0 +1,89 @@
+import pytest
+from slackformat.utils.escape_utils import escape_markdown, escape_mrkdwn, unescape_entities
+from slackformat.converters.md_to_richtext import md_to_richtext
+from slackformat.converters.richtext_to_blockkit import richtext_to_blockkit
+from slackformat.converters.blockkit_to_md import blockkit_to_markdown
+from slackformat.converters.md_to_blockkit import md_to_blockkit
+from slackformat.formatters.link_formatter import format_link_element_to_mrkdwn
+from slackformat.parsers.richtext_parser import parse_rich_text_to_mrkdwn
+
+class TestEscapeUtils:
+
+    def test_escape_markdown(self):
+        assert escape_markdown("a_b [c](d) #1!") == "a\\_b \\[c\\]\\(d\\) \\#1\\!"
+        assert escape_markdown("") == ""
+
+    def test_escape_mrkdwn(self):
+        assert escape_mrkdwn("a < b && c > d") == "a &lt; b &amp;&amp; c &gt; d"
+        assert escape_mrkdwn("plain *text*") == "plain *text*"
+
+    def test_unescape_entities_single_pass(self):
+        assert unescape_entities("a &lt; b &amp; c &gt; d") == "a < b & c > d"
+        assert unescape_entities("&amp;lt;") == "&lt;"
+        assert unescape_entities("&nbsp; &") == "&nbsp; &"
+
+    @pytest.mark.parametrize("text", ["", "x", "<&>", "&amp;", "a &lt;b&gt; & &&amp;"])
+    def test_mrkdwn_round_trip(self, text):
+        assert unescape_entities(escape_mrkdwn(text)) == text
+
+    def test_parser_decodes_entities(self):
+        result = md_to_richtext("1 &lt; 2 &amp;&amp; *a &gt; b*")
+        elements = result["elements"]
+        assert "".join(element["text"] for element in elements) == "1 < 2 && a > b"
+        assert elements[-1]["style"] == {"bold": True}
+
+    def test_encoded_brackets_are_not_links(self):
+        result = md_to_richtext("&lt;not a link&gt;")
+        assert result["elements"] == [{"type": "text", "text": "<not a link>"}]
+
+    def test_link_label_entities(self):
+        result = md_to_richtext("<https://x.test/?a=1&amp;b=2|Q&amp;A &gt; FAQ>")
+        link = result["elements"][0]
+        assert link == {"type": "link", "url": "https://x.test/?a=1&b=2", "text": "Q&A > FAQ"}
+        assert format_link_element_to_mrkdwn(link) == "<https://x.test/?a=1&amp;b=2|Q&amp;A &gt; FAQ>"
+
+    def test_mrkdwn_output_is_escaped(self):
+        section = {"type": "rich_text_section", "elements": [
+            {"type": "text", "text": "if a < b "},
+            {"type": "user", "user_id": "U1"},
+        ]}
+        assert parse_rich_text_to_mrkdwn(section) == "if a &lt; b <@U1>"
+
+    def test_preformatted_escapes_text_not_mentions(self):
+        block = {"type": "rich_text_preformatted", "elements": [
+            {"type": "text", "text": "x -> y "},
+            {"type": "user", "user_id": "U1"},
+        ]}
+        assert parse_rich_text_to_mrkdwn(block) == "```\nx -&gt; y <@U1>\n```"
+
+    def test_richtext_blockkit_round_trip(self):
+        source = "a <b> & c"
+        block = richtext_to_blockkit(md_to_richtext("a &lt;b&gt; &amp; c"))
+        assert block["text"]["text"] == "a &lt;b&gt; &amp; c"
+        text = md_to_richtext(block["text"]["text"])["elements"]
+        assert "".join(element["text"] for element in text) == source
+
+    @pytest.mark.parametrize("block", [
+        {"type": "section", "text": {"type": "mrkdwn", "text": "if a &lt;b&gt; then &amp;"}},
+        {"type": "context", "elements": [{"type": "mrkdwn", "text": "if a &lt;b&gt; then &amp;"}]},
+        {"type": "rich_text", "elements": [
+            {"type": "rich_text_section", "elements": [{"type": "text", "text": "if a <b> then &"}]},
+        ]},
+    ])
+    def test_blockkit_markdown_chain_keeps_entities(self, block):
+        markdown = blockkit_to_markdown(block)
+        assert "&lt;b&gt;" in markdown
+        elements = md_to_richtext(markdown)["elements"]
+        assert all(element["type"] == "text" for element in elements)
+        assert "".join(element["text"] for element in elements) == "if a <b> then &"
+        assert md_to_blockkit(markdown)["text"]["text"] == markdown
+
+    def test_rich_text_markdown_keeps_literal_entities(self):
+        block = {"type": "rich_text", "elements": [{"type": "rich_text_section", "elements": [
+            {"type": "text", "text": "x &lt; y"},
+            {"type": "link", "url": "https://a.com/?a=1&b=2", "text": "<docs>"},
+        ]}]}
+        markdown = blockkit_to_markdown(block)
+        assert markdown == "x &amp;lt; y[&lt;docs&gt;](https://a.com/?a=1&amp;b=2)"
+        elements = md_to_richtext(markdown)["elements"]
+        assert "".join(element["text"] for element in elements) == "x &lt; y[<docs>](https://a.com/?a=1&b=2)"
@@ -0,0 +1,88 @@
+import gc
+import copy
+import json
+import pickle
+import pytest
+from slackformat.utils.intern_utils import FrozenDict, FrozenList, Interner, resolve_interner, default_interner
+from slackformat.utils.merge_utils import merge_text_elements
+from slackformat.converters.md_to_richtext import MdToRichtextConverter
+from slackformat.converters.blockkit_to_richtext import BlockkitToRichtextConverter
+
+class TestInterner:
+
+    def test_identical_subtrees_are_shared(self):
+        interner = Interner()
+        first = interner.intern({"type": "text", "text": "a", "style": {"bold": True}})
+        second = interner.intern({"type": "text", "text": "b", "style": {"bold": True}})
+        assert first["style"] is second["style"]
+        assert interner.intern({"type": "text", "text": "a", "style": {"bold": True}}) is first
+
+    def test_equal_to_plain_objects(self):
+        tree = {"type": "rich_text", "elements": [{"type": "rich_text_section", "elements": []}]}
+        interned = Interner().intern(tree)
+        assert interned == tree
+        assert isinstance(interned, FrozenDict)
+        assert isinstance(interned["elements"], FrozenList)
+        assert json.dumps(interned) == json.dumps(tree)
+
+    def test_distinguishes_bool_from_int(self):
+        interner = Interner()
+        assert type(interner.intern({"v": True})["v"]) is bool
+        assert type(interner.intern({"v": 1})["v"]) is int
+
+    def test_read_only(self):
+        interned = Interner().intern({"elements": [1]})
+        with pytest.raises(TypeError):
+            interned["type"] = "x"
+        with pytest.raises(TypeError):
+            interned["elements"].append(2)
+        editable = dict(interned)
+        editable["type"] = "x"
+
+    def test_copy_and_pickle(self):
+        interned = Interner().intern({"elements": [{"bold": True}]})
+        assert pickle.loads(pickle.dumps(interned)) == interned
+        assert copy.deepcopy(interned) == interned
+
+    def test_entries_are_weak(self):
+        interner = Interner()
+        interned = interner.intern({"type": "emoji", "name": "tada"})
+        assert len(interner) == 1
+        del interned
+        gc.collect()
+        assert len(interner) == 0
+
+    def test_resolve_interner(self):
+        interner = Interner()
+        assert resolve_interner(False) is None
+        assert resolve_interner(True) is default_interner
+        assert resolve_interner(interner) is interner
+
+class TestInterningConverters:
+
+    def test_md_to_richtext(self):
+        plain = MdToRichtextConverter()
+        interned = MdToRichtextConverter(intern=Interner())
+        md = "*bold* and *bold*\n*bold* and *bold*"
+        result = interned.convert(md)
+        assert result == plain.convert(md)
+        first, second = result["elements"]
+        assert first is second
+
+    def test_blockkit_to_richtext(self):
+        converter = BlockkitToRichtextConverter(intern=True)
+        block = {"type": "header", "text": {"type": "plain_text", "text": "Title"}}
+        assert converter.convert(block) is converter.convert(dict(block))
+
+class TestMergeTextElements:
+
+    def test_does_not_copy_unmerged_elements(self):
+        elements = [{"type": "text", "text": "a"}, {"type": "emoji", "name": "x"}]
+        merged = merge_text_elements(elements)
+        assert merged[0] is elements[0]
+        assert merged[1] is elements[1]
+
+    def test_merges_without_mutating_interned_input(self):
+        elements = Interner().intern([{"type": "text", "text": "a"}, {"type": "text", "text": "b"}])
+        assert merge_text_elements(elements) == [{"type": "text", "text": "ab"}]
+        assert elements[0]["text"] == "a"
\ No newline at end of file